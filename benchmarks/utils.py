@@ -20,32 +20,53 @@ SENTENCES = [
 ]
 
 
+def _filler_pool(sentence: str):
+    """Return the PII values that fit the ``{}`` placeholder of a sentence."""
+    if "phone" in sentence:
+        return PHONES
+    if "contact" in sentence:
+        return EMAILS
+    return NAMES
+
+
 def generate_large_text(size_mb: float = 1.0) -> str:
     """
     Generates a large string of approximately `size_mb` megabytes containing PII.
+
+    A shuffled batch of sentences is repeated up to the target size and all
+    PII fillers are drawn up front with ``random.choices``. Blocks are encoded
+    into a preallocated bytearray and decoded once at the end.
     """
     target_bytes = int(size_mb * 1024 * 1024)
-    buffer = []
-    current_bytes = 0
 
-    while current_bytes < target_bytes:
-        template = random.choice(SENTENCES)
-        # Randomly insert PII or just plain text
-        if "{}" in template:
-            if "phone" in template:
-                filler = random.choice(PHONES)
-            elif "contact" in template:
-                filler = random.choice(EMAILS)
-            else:
-                filler = random.choice(NAMES)
-            text = template.format(filler)
-        else:
-            text = template
-
-        buffer.append(text)
-        current_bytes += len(text) + 1  # +1 for newline or space
-
-    return "\n".join(buffer)
+    batch = SENTENCES * 20
+    random.shuffle(batch)
+    template = "\n".join(batch)
+    repeats = target_bytes // (len(template) + 1) + 1
+
+    # One filler iterator per pool; each placeholder slot pulls from its pool.
+    pools = [_filler_pool(sentence) for sentence in batch if "{}" in sentence]
+    draws = {
+        id(pool): iter(random.choices(pool, k=pools.count(pool) * repeats))
+        for pool in pools
+    }
+    slot_draws = [draws[id(pool)] for pool in pools]
+
+    # Write each formatted block straight into one preallocated buffer rather
+    # than materialising the repeated template and its formatted copy.
+    out = bytearray(repeats * (len(template) + 64 * len(pools) + 1))
+    view = memoryview(out)
+    pos = 0
+    for _ in range(repeats):
+        block = (template.format(*map(next, slot_draws)) + "\n").encode()
+        view[pos : pos + len(block)] = block
+        pos += len(block)
+        if pos >= target_bytes:
+            break
+    view.release()
+
+    # Trim to the target size on a sentence boundary
+    return out[: out.rfind(b"\n", 0, min(pos, target_bytes))].decode()
 
 
 def generate_chunk_stream(
@@ -63,60 +84,81 @@ def generate_flat_json(size_mb: float = 1.0) -> str:
     Generates a large JSON string (list of flat objects) of approximately `size_mb`.
     """
     target_bytes = int(size_mb * 1024 * 1024)
-    data = []
-    current_bytes = 0
-
-    # Estimate size of one record to batches
-    while current_bytes < target_bytes:
-        record = {
-            "id": random.randint(1000, 9999),
-            "name": random.choice(NAMES),
-            "email": random.choice(EMAILS),
-            "phone": random.choice(PHONES),
-            "notes": (
-                random.choice(SENTENCES).format(random.choice(EMAILS))
-                if "{}" in random.choice(SENTENCES)
-                else "No notes."
-            ),
+    # Rough estimation of JSON size overhead: ~100 bytes per record
+    count = -(-target_bytes // 100)
+
+    # Draw every random field up front in one C-level loop per column rather
+    # than several random.choice calls per record.
+    ids = random.choices(range(1000, 10000), k=count)
+    names = random.choices(NAMES, k=count)
+    emails = random.choices(EMAILS, k=count)
+    phones = random.choices(PHONES, k=count)
+    note_sentences = random.choices(SENTENCES, k=count)
+    note_emails = random.choices(EMAILS, k=count)
+    # Whether a record gets notes is decided by an independent sentence draw
+    has_notes = random.choices(["{}" in sentence for sentence in SENTENCES], k=count)
+
+    data = [
+        {
+            "id": record_id,
+            "name": name,
+            "email": email,
+            "phone": phone,
+            "notes": sentence.format(note_email) if notes else "No notes.",
         }
-        data.append(record)
-        # Rough estimation of JSON size overhead
-        current_bytes += 100  # Approx bytes per record
+        for record_id, name, email, phone, sentence, note_email, notes in zip(
+            ids, names, emails, phones, note_sentences, note_emails, has_notes
+        )
+    ]
 
     return json.dumps(data)
 
 
+def _create_nested_node(depth: int) -> Dict[str, Any]:
+    """
+    Builds one full binary tree of `depth` levels bottom-up, pairing the nodes
+    of each level under a new parent instead of recursing.
+    """
+    leaves = 2**depth
+    level = [
+        {"leaf_info": name, "contact": email}
+        for name, email in zip(
+            random.choices(NAMES, k=leaves), random.choices(EMAILS, k=leaves)
+        )
+    ]
+    for current_depth in range(1, depth + 1):
+        level = [
+            {
+                "level": current_depth,
+                "manager": random.choice(NAMES),
+                "sub_node_a": level[i],
+                "sub_node_b": level[i + 1],
+                "details": random.choices(EMAILS, k=5),
+            }
+            for i in range(0, len(level), 2)
+        ]
+    return level[0]
+
+
 def generate_nested_json(depth: int = 5, size_mb: float = 1.0) -> Dict[str, Any]:
     """
     Generates a deeply nested JSON object (dict).
     Returns the object, not string, as traverse_and_redact expects an object.
     Size approximation is loose here.
     """
-    # For nested JSON, we'll create a recursive structure.
-    # To hit size_mb, we can make a list of these nested structures.
-
-    def create_nested_node(current_depth):
-        if current_depth == 0:
-            return {"leaf_info": random.choice(NAMES), "contact": random.choice(EMAILS)}
-
-        return {
-            "level": current_depth,
-            "manager": random.choice(NAMES),
-            "sub_node_a": create_nested_node(current_depth - 1),
-            "sub_node_b": create_nested_node(current_depth - 1),
-            "details": [random.choice(EMAILS) for _ in range(5)],
-        }
-
     # To get volume, we'll create a top-level list containing many such trees
     # A single tree of depth 5 is decent size, but we need many to hit 1MB.
 
     target_bytes = int(size_mb * 1024 * 1024)
     large_structure = {"data": []}
+
+    # Every tree has the same shape, so serialise one to estimate the size of
+    # each instead of re-serialising every tree as it is appended.
+    per_tree_bytes = len(json.dumps(_create_nested_node(depth)))
     current_estimated_bytes = 0
 
     while current_estimated_bytes < target_bytes:
-        node = create_nested_node(depth)
-        large_structure["data"].append(node)
-        current_estimated_bytes += len(json.dumps(node))
+        large_structure["data"].append(_create_nested_node(depth))
+        current_estimated_bytes += per_tree_bytes
 
     return large_structure
@@ -7,6 +7,9 @@ This example shows how to:
 3. Handle cross-chunk entity detection
 """
 
+import mmap
+import os
+
 from veildata.detectors import RegexDetector
 from veildata.pipeline import DetectionPipeline
 from veildata.revealers import TokenStore
@@ -19,8 +22,8 @@ def example_1_basic_streaming():
 
     # Setup detector
     patterns = {
-        "EMAIL": r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}",
-        "PHONE": r"\d{3}-\d{4}",
+        "EMAIL": r"\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b",
+        "PHONE": r"\b\d{3}-\d{4}\b",
     }
     detector = RegexDetector(patterns)
     pipeline = DetectionPipeline(detector)
@@ -59,31 +62,33 @@ def example_2_file_streaming():
             f.write(f"Line {i}: Contact user{i}@example.com or call 555-{i:04d}\n")
 
     # Setup
-    patterns = {"EMAIL": r"\S+@\S+", "PHONE": r"\d{3}-\d{4}"}
+    patterns = {
+        "EMAIL": r"\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b",
+        "PHONE": r"\b\d{3}-\d{4}\b",
+    }
     detector = RegexDetector(patterns)
     pipeline = DetectionPipeline(detector)
     store = TokenStore()
 
-    def read_file_chunks(filepath, chunk_size=100):
-        """Generator that yields file chunks."""
-        with open(filepath, "r") as f:
-            while True:
-                chunk = f.read(chunk_size)
-                if not chunk:
-                    break
-                yield chunk
-
-    # Process using stream_redact
+    def read_file_chunks(filepath, chunk_size=65536):
+        """Generator that yields raw byte chunks of a memory-mapped file."""
+        # stream_redact decodes bytes chunks itself, carrying multi-byte
+        # characters split across chunk boundaries over to the next chunk.
+        with open(filepath, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for offset in range(0, len(mm), chunk_size):
+                    yield mm[offset : offset + chunk_size]
+
+    # Each redacted chunk is written as soon as it is produced, so memory
+    # stays bounded by the chunk size no matter how large the file is.
     print("Redacting test_input.txt...")
-    output_chunks = list(
-        stream_redact(
-            read_file_chunks("test_input.txt"), pipeline, overlap_size=30, store=store
-        )
-    )
-
-    # Write output
     with open("test_output.txt", "w") as f:
-        f.write("".join(output_chunks))
+        for redacted_chunk in stream_redact(
+            read_file_chunks("test_input.txt"), pipeline, overlap_size=30, store=store
+        ):
+            f.write(redacted_chunk)
 
     print("✓ Redacted to test_output.txt")
     print(f"✓ Found {len(store.mappings)} entities\n")
@@ -109,6 +114,9 @@ def example_3_api_usage():
     print('     -H "Content-Type: text/plain" \\')
     print("     --data-binary @input.txt > output.txt")
     print()
+    print("   Redirect the response to a file as above rather than capturing it")
+    print("   in memory; chunks are written as they arrive.")
+    print()
     print("3. With custom parameters:")
     print(
         '   $ curl -X POST "http://localhost:8000/v1/redact/stream?overlap_size=256&return_store=true" \\'
@@ -1,7 +1,11 @@
-from veildata.core import Module
-from veildata.redactors import RegexRedactor
-from veildata.revealers import TokenStore
-from veildata.transforms import Compose
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from veildata.core import Module
+    from veildata.redactors import RegexRedactor
+    from veildata.revealers import TokenStore
+    from veildata.transforms import Compose
 
 __all__ = [
     "Module",
@@ -9,3 +13,24 @@ __all__ = [
     "RegexRedactor",
     "TokenStore",
 ]
+
+# Public names are imported on first attribute access (PEP 562), so importing
+# a submodule such as veildata.cli does not load the whole package.
+_LAZY_IMPORTS = {
+    "Module": "veildata.core",
+    "Compose": "veildata.transforms",
+    "RegexRedactor": "veildata.redactors",
+    "TokenStore": "veildata.revealers",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,3 +1,4 @@
+from bisect import bisect_right
 from typing import Any, Callable, List
 
 
@@ -5,17 +6,69 @@ class Compose:
     """
     Compose multiple redaction components (RegexRedactor, SpacyRedactor, etc.)
     into a single callable pipeline.
+
+    When every module exposes ``detect(text)`` and ``render_token(span)``, the
+    modules all detect on the original text and the result is assembled in one
+    pass. Module order is precedence: a span that overlaps one kept from an
+    earlier module is dropped, and tokens are rendered module by module, so
+    counters and stores fill as they would if the modules ran one after
+    another. Unlike the sequential path, later modules never see (or match
+    inside) tokens inserted by earlier ones.
     """
 
     def __init__(self, modules: List[Callable[..., Any]]):
         self.modules = modules
 
     def __call__(self, text: str, **kwargs) -> str:
-        """Run all modules sequentially on the input text."""
+        """Redact the input text with every module."""
+        if (
+            not kwargs
+            and len(self.modules) > 1
+            and all(
+                hasattr(m, "detect") and hasattr(m, "render_token")
+                for m in self.modules
+            )
+        ):
+            return self._fused(text)
         for module in self.modules:
             text = module(text, **kwargs)
         return text
 
+    def _fused(self, text: str) -> str:
+        """Detect with every module on ``text`` and replace all spans at once."""
+        # Kept spans from all modules, non-overlapping and sorted by start
+        starts: List[int] = []
+        kept: List[Any] = []
+        rendered = {}
+        for module in self.modules:
+            accepted = []
+            module_end = 0
+            for span in sorted(module.detect(text), key=lambda s: s.start):
+                if span.start < module_end:
+                    continue
+                i = bisect_right(starts, span.start)
+                if (i and kept[i - 1].end > span.start) or (
+                    i < len(kept) and kept[i].start < span.end
+                ):
+                    continue
+                accepted.append(span)
+                module_end = span.end
+            # Render in this module's own order before the next module runs
+            for span in accepted:
+                rendered[id(span)] = module.render_token(span)
+                i = bisect_right(starts, span.start)
+                starts.insert(i, span.start)
+                kept.insert(i, span)
+
+        parts = []
+        current_idx = 0
+        for span in kept:
+            parts.append(text[current_idx : span.start])
+            parts.append(rendered[id(span)])
+            current_idx = span.end
+        parts.append(text[current_idx:])
+        return "".join(parts)
+
     def __repr__(self):
         names = [m.__class__.__name__ for m in self.modules]
         return f"Compose({', '.join(names)})"
@@ -1,8 +1,13 @@
+import hashlib
 import json
 import os
+import pickle
+import re
+import sys
+from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Mapping, Optional, Pattern, Tuple
 
 import yaml
 from pydantic import BaseModel, Field, ValidationError
@@ -29,6 +34,54 @@ class TraversalPolicy(str, Enum):
     DENY = "deny"
 
 
+# --- Runtime Snapshots ---
+
+# Slotted dataclasses need Python 3.10+; older versions get regular ones.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
+class RuntimeTraversal:
+    """Immutable traversal rules with key sets prebuilt for O(1) lookups."""
+
+    redact_keys: FrozenSet[str]
+    ignore_keys: FrozenSet[str]
+    allow: bool
+    max_depth: int
+
+    @property
+    def redact_by_default(self) -> bool:
+        """Whether values under keys without a rule are redacted."""
+        return not (self.allow and self.redact_keys)
+
+    def key_decision(self, key: str, path: str) -> Optional[bool]:
+        """
+        Decide how values under a JSON key are handled.
+
+        Entries match either the bare key or its dotted path from the root
+        (e.g. ``address.firstLine``; list indices are not part of the path).
+        Returns False for ignored keys, True for keys to redact under the
+        ``allow`` policy, and None when the parent's decision applies.
+        """
+        if key in self.ignore_keys or path in self.ignore_keys:
+            return False
+        if self.allow and (key in self.redact_keys or path in self.redact_keys):
+            return True
+        return None
+
+
+@dataclass(frozen=True, **_SLOTS)
+class RuntimeConfig:
+    """Read-only view of a ``VeilConfig`` for hot paths. See ``VeilConfig.to_runtime``."""
+
+    method: str
+    patterns: Dict[str, Pattern]
+    traversal: RuntimeTraversal
+    hybrid_strategy: str
+    hybrid_prefer: str
+    fallback: str
+
+
 # --- Configuration Models ---
 
 
@@ -36,6 +89,10 @@ class SpacyConfig(BaseModel):
     enabled: bool = False
     model: str = "en_core_web_lg"
     pii_labels: Optional[List[str]] = None
+    # Transformer models (en_core_web_trf) are meant to run on a GPU
+    use_gpu: bool = False
+    # Texts per nlp.pipe batch; None picks 128 on a GPU and 64 on the CPU
+    batch_size: Optional[int] = None
 
 
 class BertConfig(BaseModel):
@@ -43,6 +100,16 @@ class BertConfig(BaseModel):
     model_path: str = "dslim/bert-base-NER"
     threshold: float = 0.5
     label_mapping: Optional[Dict[str, str]] = None
+    # Sentences per model call; values above 1 split texts into sentences
+    batch_size: int = 1
+    # Pipeline device: -1 for CPU, 0+ for a GPU index, None to auto-detect
+    device: Optional[int] = None
+    # Pack detect_batch inputs by length into batches of at most this many tokens
+    max_tokens_per_batch: Optional[int] = None
+    # fp32 | fp16 | bf16 | int8; None picks bf16/fp16 on a GPU, fp32 on the CPU
+    precision: Optional[str] = None
+    # ner_bert: torch.compile the model (after IPEX on the CPU, if installed)
+    optimize: bool = False
 
 
 class MLConfig(BaseModel):
@@ -58,6 +125,35 @@ class TraversalConfig(BaseModel):
     keys_to_ignore: List[str] = Field(default_factory=list)
     max_depth: int = 100
 
+    def to_runtime(self) -> "RuntimeTraversal":
+        """
+        Snapshot these rules as an immutable ``RuntimeTraversal``.
+
+        Built on each call, so later edits to this model are picked up; the
+        JSON walkers take one snapshot per document.
+        """
+        return RuntimeTraversal(
+            redact_keys=frozenset(self.keys_to_redact),
+            ignore_keys=frozenset(self.keys_to_ignore),
+            allow=self.policy == TraversalPolicy.ALLOW,
+            max_depth=self.max_depth,
+        )
+
+    @property
+    def redact_by_default(self) -> bool:
+        """Whether values under keys without a rule are redacted."""
+        return not (self.policy == TraversalPolicy.ALLOW and self.keys_to_redact)
+
+    def key_decision(self, key: str, path: str) -> Optional[bool]:
+        """See ``RuntimeTraversal.key_decision``; reads the current fields."""
+        if key in self.keys_to_ignore or path in self.keys_to_ignore:
+            return False
+        if self.policy == TraversalPolicy.ALLOW and (
+            key in self.keys_to_redact or path in self.keys_to_redact
+        ):
+            return True
+        return None
+
 
 class HybridOptions(BaseModel):
     strategy: str = "union"
@@ -92,17 +188,131 @@ class VeilConfig(BaseModel):
         """Helper to get patterns from either 'patterns' or 'pattern' field."""
         return self.patterns or self.pattern or {}
 
+    def to_runtime(self) -> "RuntimeConfig":
+        """
+        Snapshot this config as a frozen, slotted ``RuntimeConfig``.
+
+        Pydantic validates at load time; hot loops read the snapshot, whose
+        plain attributes are cheaper to access. Patterns are compiled here,
+        so an invalid regex raises ``re.error``.
+        """
+        return RuntimeConfig(
+            method=self.method.value,
+            patterns={
+                label: re.compile(pattern)
+                for label, pattern in self.get_patterns().items()
+            },
+            traversal=self.traversal.to_runtime(),
+            hybrid_strategy=self.options.hybrid.strategy,
+            hybrid_prefer=self.options.hybrid.prefer,
+            fallback=self.options.fallback,
+        )
+
 
 # --- Loading Logic ---
 
+# Bump whenever the config models change so stale on-disk caches are ignored.
+_SCHEMA_VERSION = 12
+
+# (path, mtime_ns, size, VEILDATA_METHOD) -> validated config
+_CacheKey = Tuple[str, int, int, Optional[str]]
+_CONFIG_CACHE: Dict[_CacheKey, VeilConfig] = {}
+
+
+def _cache_file(path: str) -> Path:
+    digest = hashlib.sha256(path.encode("utf-8")).hexdigest()[:16]
+    cache_dir = os.getenv("VEILDATA_CACHE_DIR") or Path.home() / ".veildata" / ".cache"
+    return Path(cache_dir) / f"config.{digest}.pkl"
 
-def load_config(config_path: Optional[str] = None, verbose: bool = False) -> VeilConfig:
+
+def _read_disk_cache(key: _CacheKey) -> Optional[VeilConfig]:
+    try:
+        with open(_cache_file(key[0]), "rb") as f:
+            version, cached_key, config = pickle.load(f)
+    except Exception:
+        return None
+    if version != _SCHEMA_VERSION or cached_key != key:
+        return None
+    return config if isinstance(config, VeilConfig) else None
+
+
+def _write_disk_cache(key: _CacheKey, config: VeilConfig) -> None:
+    cache_file = _cache_file(key[0])
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump((_SCHEMA_VERSION, key, config), f)
+        os.replace(tmp, cache_file)
+    except OSError:
+        # The cache is an optimisation only; an unwritable home is fine.
+        pass
+
+
+# Local config files checked, in order, before the one in the home directory.
+_LOCAL_DEFAULTS = ("veildata.yaml", "veildata.json", "veildata.toml")
+
+# Home config path -> whether it exists, checked once per process.
+_HOME_CONFIG_EXISTS: Dict[str, bool] = {}
+
+
+def _find_default_config() -> Optional[str]:
+    """Return the first local default config, else the home one, if any."""
+    # One directory listing instead of a stat per candidate
+    try:
+        with os.scandir(".") as it:
+            entries = {entry.name for entry in it}
+    except OSError:
+        entries = set()
+    for local in _LOCAL_DEFAULTS:
+        if local in entries:
+            return local
+
+    default_path = Path.home() / ".veildata" / "config.toml"
+    key = str(default_path)
+    exists = _HOME_CONFIG_EXISTS.get(key)
+    if exists is None:
+        exists = _HOME_CONFIG_EXISTS[key] = default_path.exists()
+    return key if exists else None
+
+
+# Environment variables that override config fields.
+_ENV_OVERRIDES = {"VEILDATA_METHOD": "method"}
+
+
+def env_overrides(
+    environ: Optional[Mapping[str, str]] = None,
+) -> Tuple[Tuple[str, str], ...]:
+    """Snapshot the non-empty ``VEILDATA_*`` overrides as ``(field, value)`` pairs."""
+    environ = os.environ if environ is None else environ
+    return tuple(
+        (field, environ[var])
+        for var, field in _ENV_OVERRIDES.items()
+        if environ.get(var)
+    )
+
+
+def load_config(
+    config_path: Optional[str] = None,
+    verbose: bool = False,
+    use_cache: bool = True,
+    overrides: Optional[Tuple[Tuple[str, str], ...]] = None,
+) -> VeilConfig:
     """
     Load configuration from a file or environment variables.
 
+    Parsed configs are cached in memory and under ``~/.veildata/.cache``,
+    (or ``$VEILDATA_CACHE_DIR``) keyed by the file's path, mtime and size, so repeated loads of an
+    unchanged file skip parsing and validation. Without a file, the defaults
+    are cached in memory. Both keys include the env overrides. Callers get
+    their own copy.
+
     Args:
         config_path: Path to the config file (YAML, JSON, TOML).
         verbose: Whether to print loading status.
+        use_cache: Whether to read and write the parsed-config cache.
+        overrides: Field overrides from ``env_overrides()``; read from the
+            environment when None.
 
     Returns:
         VeilConfig object.
@@ -115,24 +325,38 @@ def load_config(config_path: Optional[str] = None, verbose: bool = False) -> Vei
 
     # 1. Resolve Path
     if not config_path:
-        default_path = Path.home() / ".veildata" / "config.toml"
-        # Also check local directory for config.yaml/json/toml
-        local_defaults = ["veildata.yaml", "veildata.json", "veildata.toml"]
-
-        for local in local_defaults:
-            if Path(local).exists():
-                config_path = local
-                break
+        config_path = _find_default_config()
 
-        if not config_path and default_path.exists():
-            config_path = str(default_path)
+    if overrides is None:
+        overrides = env_overrides()
 
     # 2. Load File
-    if config_path:
+    cache_key = None
+    if not config_path and use_cache:
+        # Defaults depend only on the overrides
+        cache_key = ("", overrides)
+        config = _CONFIG_CACHE.get(cache_key)
+        if config is not None:
+            return config.model_copy(deep=True)
+    elif config_path:
         path = Path(config_path)
-        if not path.exists():
+        try:
+            stat = path.stat()
+        except OSError:
             raise ConfigMissingError(f"Configuration file not found: {config_path}")
 
+        cache_key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size, overrides)
+        config = _CONFIG_CACHE.get(cache_key) if use_cache else None
+        if config is None and use_cache:
+            config = _read_disk_cache(cache_key)
+            if config is not None:
+                _CONFIG_CACHE[cache_key] = config
+        if config is not None:
+            if verbose:
+                print(f"[veildata] Loaded config from {path.absolute()} (cached)")
+            # Callers may mutate the result (e.g. inject default patterns)
+            return config.model_copy(deep=True)
+
         try:
             text = path.read_text(encoding="utf-8")
             if verbose:
@@ -151,16 +375,20 @@ def load_config(config_path: Optional[str] = None, verbose: bool = False) -> Vei
                 print(f"[veildata] Error loading config: {e}")
             raise e
 
-    # 3. Environment Variable Overrides (Minimal example)
-    # VEILDATA_METHOD=ner_spacy override
-    env_method = os.getenv("VEILDATA_METHOD")
-    if env_method:
-        config_dict["method"] = env_method
+    # 3. Environment Variable Overrides (e.g. VEILDATA_METHOD=ner_spacy)
+    config_dict.update(overrides)
 
     # 4. Validate and Return
     try:
-        return VeilConfig(**config_dict)
+        config = VeilConfig(**config_dict)
     except ValidationError as e:
         if verbose:
             print(f"[veildata] Configuration validation error: {e}")
         raise e
+
+    if cache_key is not None and use_cache:
+        _CONFIG_CACHE[cache_key] = config
+        if config_path:
+            _write_disk_cache(cache_key, config)
+        return config.model_copy(deep=True)
+    return config
@@ -1,3 +1,7 @@
+import re
+from functools import partial
+from typing import Callable, Dict, Match, Tuple
+
 # Default regex patterns for one-shot redaction
 DEFAULT_PATTERNS = {
     "EMAIL": r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
@@ -5,3 +9,64 @@ DEFAULT_PATTERNS = {
     "IPV4": r"\b(?:\d{1,3}\.){3}\d{1,3}\b",
     "SSN": r"\b\d{3}-\d{2}-\d{4}\b",
 }
+
+# Compiled once at import and shared by every regex detector built from the
+# defaults, so repeated builds skip re-compiling them.
+DEFAULT_COMPILED_PATTERNS = {
+    label: re.compile(pattern) for label, pattern in DEFAULT_PATTERNS.items()
+}
+
+# All defaults in one alternation, so a text is scanned once rather than once
+# per pattern. The matching group name (``match.lastgroup``) is the label.
+DEFAULT_UNION_PATTERN = re.compile(
+    "|".join(f"(?P<{label}>{pattern})" for label, pattern in DEFAULT_PATTERNS.items())
+)
+
+# Every default match contains an "@" (EMAIL) or a digit (the rest), so text
+# without either cannot match. One character-class search rejects it far
+# faster than running the union over clean text.
+DEFAULT_CANDIDATE = re.compile(r"[\d@]")
+
+
+# Pattern set -> redaction function, see ``compile_redactor``.
+_COMPILED_REDACTORS: Dict[Tuple[Tuple[str, str], ...], Callable[[str], str]] = {}
+
+
+def compile_redactor(patterns: Dict[str, str]) -> Callable[[str], str]:
+    """
+    Build a function that replaces every match with ``<LABEL>`` in one pass.
+
+    The patterns are joined into one alternation and each group name maps to
+    a prebuilt token, so a match costs one dict lookup instead of formatting
+    a string. Functions are cached per pattern set.
+    """
+    key = tuple(patterns.items())
+    redactor = _COMPILED_REDACTORS.get(key)
+    if redactor is None:
+        if patterns == DEFAULT_PATTERNS:
+            union = DEFAULT_UNION_PATTERN
+            tokens = {label: f"<{label}>" for label in patterns}
+        else:
+            # Labels need not be valid group names, so groups are numbered
+            union = re.compile(
+                "|".join(f"(?P<_{i}>{p})" for i, p in enumerate(patterns.values()))
+            )
+            tokens = {f"_{i}": f"<{label}>" for i, label in enumerate(patterns)}
+
+        def replace(match: Match, _token=tokens.__getitem__) -> str:
+            return _token(match.lastgroup)
+
+        redactor = partial(union.sub, replace)
+        if union is DEFAULT_UNION_PATTERN:
+            redactor = partial(_redact_candidates, redactor)
+        _COMPILED_REDACTORS[key] = redactor
+    return redactor
+
+
+def _redact_candidates(redact: Callable[[str], str], text: str) -> str:
+    return redact(text) if DEFAULT_CANDIDATE.search(text) else text
+
+
+def redact_with_defaults(text: str) -> str:
+    """Replace every default-pattern match with ``<LABEL>`` in one pass."""
+    return compile_redactor(DEFAULT_PATTERNS)(text)
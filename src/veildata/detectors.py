@@ -1,10 +1,143 @@
 import re
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
+from typing import Callable, Dict, List, Optional, Pattern, Tuple, Union
 
+from veildata.defaults import (
+    DEFAULT_CANDIDATE,
+    DEFAULT_COMPILED_PATTERNS,
+    DEFAULT_UNION_PATTERN,
+)
 
-@dataclass
+# Numbered backreferences change meaning once patterns are wrapped in groups.
+_NUMBERED_BACKREF = re.compile(r"\\[1-9]")
+
+# Flags that can be scoped to one alternative as ``(?flags:...)``.
+_INLINE_FLAGS = (
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+)
+_INLINE_FLAG_MASK = re.IGNORECASE | re.MULTILINE | re.DOTALL | re.VERBOSE
+
+
+def _pattern_source(pattern: Union[str, Pattern[str]]) -> Optional[str]:
+    """Return a pattern's source with its flags inlined, or None if they cannot be."""
+    if not isinstance(pattern, re.Pattern):
+        return pattern
+    flags = pattern.flags & ~re.UNICODE
+    if not flags:
+        return pattern.pattern
+    if flags & ~_INLINE_FLAG_MASK:
+        return None
+    letters = "".join(letter for flag, letter in _INLINE_FLAGS if flags & flag)
+    return f"(?{letters}:{pattern.pattern})"
+
+
+# A literal alternative: no regex metacharacters at all.
+_LITERAL_ALTERNATIVE = re.compile(r"[^.^$*+?{}\[\]\\|()]+")
+
+# Below this many literals, scanning them as a regex alternation is as fast.
+_AHOCORASICK_MIN_LITERALS = 64
+
+# Whitespace after sentence-ending punctuation, used to batch NER inference.
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
+
+def split_sentences(text: str) -> List[Tuple[int, str]]:
+    """Split text into ``(offset, sentence)`` pairs, dropping empty pieces."""
+    sentences = []
+    start = 0
+    for match in _SENTENCE_BOUNDARY.finditer(text):
+        if match.start() > start:
+            sentences.append((start, text[start : match.start()]))
+        start = match.end()
+    if start < len(text):
+        sentences.append((start, text[start:]))
+    return sentences
+
+
+REGEX_ENGINES = ("re", "re2", "hyperscan")
+
+
+def _load_regex_engine(engine: str):
+    """Return the module used to compile patterns for the given engine name."""
+    if engine in ("re", "hyperscan"):
+        # Hyperscan only scans; the stdlib patterns back its fallback path.
+        return re
+    if engine == "re2":
+        try:
+            import re2
+        except ImportError:
+            raise ImportError(
+                "google-re2 is required for engine='re2'. Install it with `pip install veildata[re2]`"
+            )
+        return re2
+    raise ValueError(
+        f"Unknown regex engine '{engine}'. Available: {', '.join(REGEX_ENGINES)}"
+    )
+
+
+@lru_cache(maxsize=128)
+def _compile_with(engine, source: str):
+    """
+    Compile ``source`` with an engine module, memoized across detectors.
+
+    ``re`` keeps a small cache of its own, but re2 has none, and every
+    detector built from the same patterns would recompile the same union.
+    """
+    return engine.compile(source)
+
+
+def _literal_alternatives(
+    patterns: Dict[str, Union[str, Pattern[str]]],
+) -> Dict[str, List[str]]:
+    """Return the patterns that are plain ``word|word|...`` alternations, split
+    into their words."""
+    literals = {}
+    for label, pat in patterns.items():
+        if isinstance(pat, re.Pattern):
+            if pat.flags & ~re.UNICODE:
+                continue
+            pat = pat.pattern
+        words = pat.split("|")
+        if all(_LITERAL_ALTERNATIVE.fullmatch(word) for word in words):
+            literals[label] = words
+    return literals
+
+
+def _build_automaton(literals: Dict[str, List[str]]):
+    """Build an Aho-Corasick automaton over the literals, or None without
+    pyahocorasick. Values are ``(priority, label, length)``, where priority is
+    the word's position in a union of all the alternations."""
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+    automaton = ahocorasick.Automaton()
+    priority = 0
+    for label, words in literals.items():
+        for word in words:
+            if word not in automaton:
+                automaton.add_word(word, (priority, label, len(word)))
+            priority += 1
+    automaton.make_automaton()
+    return automaton
+
+
+# Slotted dataclasses need Python 3.10+; older versions get regular ones.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# Slotted: detectors create one per match, so a per-instance __dict__ would
+# dominate memory on span-heavy documents.
+@dataclass(**_SLOTS)
 class EntitySpan:
     start: int
     end: int
@@ -19,32 +152,346 @@ class Detector(ABC):
     def detect(self, text: str) -> List[EntitySpan]:
         pass
 
+    def detect_batch(self, texts: List[str]) -> List[List[EntitySpan]]:
+        """Detect entities in several texts. Override when batching is cheaper."""
+        detect = self.detect
+        return [detect(text) for text in texts]
+
+
+def _to_char_offsets(data: bytes, spans: List[EntitySpan]) -> List[EntitySpan]:
+    """Convert sorted, non-overlapping byte-offset spans of UTF-8 ``data`` to
+    character offsets, decoding each gap once."""
+    converted = []
+    byte_pos = char_pos = 0
+    for span in spans:
+        char_pos += len(data[byte_pos : span.start].decode("utf-8"))
+        start = char_pos
+        char_pos += len(span.text)
+        byte_pos = span.end
+        converted.append(replace(span, start=start, end=char_pos))
+    return converted
+
 
 class RegexDetector(Detector):
-    def __init__(self, patterns: Dict[str, str]):
-        self.patterns = {label: re.compile(pat) for label, pat in patterns.items()}
+    def __init__(
+        self, patterns: Dict[str, Union[str, Pattern[str]]], engine: str = "re"
+    ):
+        self.engine = engine
+        self._engine = _load_regex_engine(engine)
+        # Cheap pre-check that rejects texts no pattern can match. Compared by
+        # value so unpickled copies of the defaults keep it.
+        self._candidate = (
+            DEFAULT_CANDIDATE if patterns == DEFAULT_COMPILED_PATTERNS else None
+        )
+        self.patterns = {label: self._compile(pat) for label, pat in patterns.items()}
+        # Long keyword lists (``name|name|...``) are matched with Aho-Corasick
+        # in one linear pass when pyahocorasick is installed; Python's re
+        # tries every alternative at every position.
+        self._automaton = None
+        if engine == "re":
+            literals = _literal_alternatives(patterns)
+            if sum(map(len, literals.values())) >= _AHOCORASICK_MIN_LITERALS:
+                self._automaton = _build_automaton(literals)
+            if self._automaton is not None:
+                patterns = {
+                    label: pat
+                    for label, pat in patterns.items()
+                    if label not in literals
+                }
+        # Bind each pattern's finditer once so detect() skips the attribute
+        # and dict lookups per call.
+        self._compiled = [(label, self.patterns[label].finditer) for label in patterns]
+        # All patterns joined into one alternation so the text is scanned once.
+        self._group_labels: Optional[Dict[str, str]] = None
+        self._union = self._compile_union(patterns)
+        self._hs_db = self._compile_hyperscan() if engine == "hyperscan" else None
+
+    def __reduce__(self):
+        # The engine module and Hyperscan database cannot be pickled; rebuild
+        # them from the patterns (e.g. when shipped to worker processes).
+        return type(self), (self.patterns, self.engine)
+
+    def _compile(self, pattern: Union[str, Pattern[str]]) -> Pattern[str]:
+        # Precompiled patterns (e.g. DEFAULT_COMPILED_PATTERNS) are reused as-is.
+        if isinstance(pattern, re.Pattern):
+            if self._engine is re:
+                return pattern
+            pattern = pattern.pattern
+        # Syntax the selected engine rejects (e.g. lookarounds under RE2)
+        # is compiled with the standard library instead.
+        try:
+            return _compile_with(self._engine, pattern)
+        except self._engine.error:
+            if self._engine is re:
+                raise
+            return re.compile(pattern)
+
+    def _compile_union(
+        self, patterns: Dict[str, Union[str, Pattern[str]]]
+    ) -> Optional[Pattern[str]]:
+        """
+        Join patterns into ``(?P<LABEL>...)|(?P<LABEL>...)``.
+
+        Labels that are not identifiers get numbered groups, recorded in
+        ``self._group_labels``. Returns None when the patterns cannot be
+        safely combined, in which case detect() falls back to scanning once
+        per pattern.
+        """
+        if not patterns:
+            return None
+        if patterns is DEFAULT_COMPILED_PATTERNS and self._engine is re:
+            return DEFAULT_UNION_PATTERN
+        sources = {}
+        for label, pat in patterns.items():
+            if (
+                isinstance(pat, re.Pattern)
+                and pat.flags & ~re.UNICODE
+                and self._engine is not re
+            ):
+                return None
+            # Keep the flags by scoping them to the pattern's group
+            source = _pattern_source(pat)
+            if source is None:
+                return None
+            sources[label] = source
+        if any(_NUMBERED_BACKREF.search(pat) for pat in sources.values()):
+            return None
+        if all(label.isidentifier() for label in sources):
+            groups = dict(sources)
+        else:
+            # Labels like "E-MAIL" are not valid group names; number the
+            # groups and map them back in detect().
+            self._group_labels = {f"_{i}": label for i, label in enumerate(sources)}
+            groups = {f"_{i}": pat for i, pat in enumerate(sources.values())}
+        try:
+            return _compile_with(
+                self._engine,
+                "|".join(f"(?P<{name}>{pat})" for name, pat in groups.items()),
+            )
+        except self._engine.error:
+            self._group_labels = None
+            return None
+
+    def _compile_hyperscan(self):
+        """Compile every pattern into one block-mode Hyperscan database."""
+        try:
+            import hyperscan
+        except ImportError:
+            raise ImportError(
+                "hyperscan is required for engine='hyperscan'. Install it with `pip install veildata[hyperscan]`"
+            )
+
+        self._hs_labels = list(self.patterns)
+        count = len(self._hs_labels)
+        expressions = [p.pattern.encode() for p in self.patterns.values()]
+        flags = hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_UTF8
+        # UCP makes \d, \w and case folding Unicode-aware, like the re engine,
+        # but Hyperscan rejects \b with it. Without UCP, matches agree with re
+        # on ASCII text only, so other text is scanned with re.
+        self._hs_ascii_only = False
+        for ucp in (True, False):
+            db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            try:
+                db.compile(
+                    expressions=expressions,
+                    ids=list(range(count)),
+                    elements=count,
+                    flags=[flags | hyperscan.HS_FLAG_UCP if ucp else flags] * count,
+                )
+            except hyperscan.error as e:
+                error = e
+                continue
+            self._hs_ascii_only = not ucp
+            return db
+        print(
+            f"[veildata] Hyperscan cannot compile these patterns ({error}). "
+            "Scanning with the 're' engine.",
+            file=sys.stderr,
+        )
+        return None
+
+    def scan_bytes(self, data: bytes) -> List[EntitySpan]:
+        """
+        Scan a bytes buffer with the Hyperscan database.
+
+        Span offsets are byte offsets into ``data``. Hyperscan reports every
+        match end, so the longest match per start is kept and overlaps are
+        resolved leftmost-first, in pattern order, like the ``re`` path.
+        """
+        if self._hs_db is None:
+            raise RuntimeError("scan_bytes requires RegexDetector(engine='hyperscan')")
+
+        data = bytes(data)
+        longest: Dict[tuple, int] = {}
+
+        def on_match(pattern_id, start, end, flags, context):
+            key = (start, pattern_id)
+            if longest.get(key, -1) < end:
+                longest[key] = end
+
+        self._hs_db.scan(data, match_event_handler=on_match)
+
+        spans = []
+        last_end = -1
+        for (start, pattern_id), end in sorted(longest.items()):
+            if start < last_end:
+                continue
+            spans.append(
+                EntitySpan(
+                    start=start,
+                    end=end,
+                    label=self._hs_labels[pattern_id],
+                    score=1.0,
+                    source="regex",
+                    text=data[start:end].decode("utf-8", "replace"),
+                )
+            )
+            last_end = end
+        return spans
 
     def detect(self, text: str) -> List[EntitySpan]:
+        if self._candidate is not None and not self._candidate.search(text):
+            return []
+        if self._hs_db is not None:
+            # Byte offsets equal character offsets only for ASCII text
+            if text.isascii():
+                return self.scan_bytes(text.encode("ascii"))
+            if not self._hs_ascii_only:
+                try:
+                    data = text.encode("utf-8")
+                except UnicodeEncodeError:
+                    pass  # lone surrogates; scan with re below
+                else:
+                    return _to_char_offsets(data, self.scan_bytes(data))
+
+        if self._automaton is not None:
+            spans = self._scan_literals(text)
+            if self._compiled:
+                spans.extend(self._detect_regex(text))
+                spans.sort(key=_START)
+            return spans
+        return self._detect_regex(text)
+
+    def substitute(self, text: str, render: Callable[[str, str], str]) -> Optional[str]:
+        """
+        Replace every match in a single ``sub`` scan, without building spans.
+
+        ``render(label, original)`` returns each replacement. Returns None
+        when this detector cannot scan that way (Hyperscan, keyword automaton
+        or patterns that are scanned one at a time); use detect() instead.
+        """
+        union = self._union
+        if union is None or self._hs_db is not None or self._automaton is not None:
+            return None
+        if self._candidate is not None and not self._candidate.search(text):
+            return text
+        group_labels = self._group_labels
+        if group_labels is not None:
+            return union.sub(
+                lambda match: render(group_labels[match.lastgroup], match.group()),
+                text,
+            )
+        return union.sub(lambda match: render(match.lastgroup, match.group()), text)
+
+    def _scan_literals(self, text: str) -> List[EntitySpan]:
+        # The automaton reports every occurrence; keep the alternation's
+        # semantics: leftmost match first, earliest word on ties, no overlaps.
+        matches = sorted(
+            (end - length + 1, priority, end + 1, label)
+            for end, (priority, label, length) in self._automaton.iter(text)
+        )
         spans = []
-        for label, pattern in self.patterns.items():
-            for match in pattern.finditer(text):
-                spans.append(
-                    EntitySpan(
-                        start=match.start(),
-                        end=match.end(),
-                        label=label,
-                        score=1.0,
-                        source="regex",
-                        text=match.group(),
-                    )
+        last_end = -1
+        for start, _, end, label in matches:
+            if start < last_end:
+                continue
+            spans.append(
+                EntitySpan(
+                    start=start,
+                    end=end,
+                    label=label,
+                    score=1.0,
+                    source="regex",
+                    text=text[start:end],
+                )
+            )
+            last_end = end
+        return spans
+
+    def _detect_regex(self, text: str) -> List[EntitySpan]:
+        # Per-match overhead dominates on match-dense text: one span() call
+        # instead of start()/end(), and positional EntitySpan arguments
+        # (start, end, label, score, source, text).
+        spans = []
+        append = spans.append
+        if self._union is not None:
+            group_labels = self._group_labels
+            if group_labels is not None:
+                for match in self._union.finditer(text):
+                    start, end = match.span()
+                    label = group_labels[match.lastgroup]
+                    append(EntitySpan(start, end, label, 1.0, "regex", match.group()))
+                return spans
+            for match in self._union.finditer(text):
+                start, end = match.span()
+                append(
+                    EntitySpan(start, end, match.lastgroup, 1.0, "regex", match.group())
                 )
+            return spans
+
+        for label, finditer in self._compiled:
+            for match in finditer(text):
+                start, end = match.span()
+                append(EntitySpan(start, end, label, 1.0, "regex", match.group()))
         return spans
 
 
+# Pipeline components NER does not need. They are excluded when loading
+# spaCy models, so they are neither run nor loaded into memory. ``ner`` and
+# the ``tok2vec``/``transformer`` it listens to are kept.
+SPACY_UNUSED_PIPES = ["parser", "tagger", "lemmatizer", "attribute_ruler", "senter"]
+
+
+def _activate_spacy_gpu(spacy) -> None:
+    """Move spaCy onto the GPU, warning and staying on CPU if there is none."""
+    if not spacy.prefer_gpu():
+        print(
+            "[veildata] GPU requested but not available; running spaCy on CPU.",
+            file=sys.stderr,
+        )
+
+
+@lru_cache(maxsize=4)
+def _load_spacy(load: Callable, model: str, exclude: Tuple[str, ...], gpu: bool):
+    """
+    ``spacy.load`` memoized per process, so detectors and redactors built for
+    the same model share its weights instead of loading them again.
+
+    ``gpu`` only separates the cache entries: where a model lives is decided
+    by ``spacy.prefer_gpu()`` before the first load.
+    """
+    return load(model, exclude=list(exclude))
+
+
 class SpacyDetector(Detector):
     def __init__(
-        self, model: str = "en_core_web_lg", pii_labels: Optional[List[str]] = None
+        self,
+        model: str = "en_core_web_lg",
+        pii_labels: Optional[List[str]] = None,
+        use_gpu: bool = False,
+        batch_size: Optional[int] = None,
+        n_process: int = 1,
+        shared: bool = True,
     ):
+        """
+        Transformer pipelines such as ``en_core_web_trf`` should be paired
+        with ``use_gpu=True``. ``batch_size`` defaults to 128 on a GPU, where
+        larger ``nlp.pipe`` batches pay off, and 64 on the CPU. Set
+        ``shared=False`` to load a private copy of the model, e.g. when its
+        pipeline is going to be modified.
+        """
+        self.batch_size = batch_size or (128 if use_gpu else 64)
+        self.n_process = n_process
         try:
             import spacy
         except ImportError:
@@ -88,8 +535,17 @@ class SpacyDetector(Detector):
                     f"Please download it manually with `python -m spacy download {model}`"
                 )
 
+        # Must run before spacy.load so the model is allocated on the GPU
+        if use_gpu:
+            _activate_spacy_gpu(spacy)
+
         try:
-            self.nlp = spacy.load(model)
+            if shared:
+                self.nlp = _load_spacy(
+                    spacy.load, model, tuple(SPACY_UNUSED_PIPES), use_gpu
+                )
+            else:
+                self.nlp = spacy.load(model, exclude=SPACY_UNUSED_PIPES)
         except OSError:
             raise OSError(
                 f"spaCy model '{model}' not found. Please download it with `python -m spacy download {model}`"
@@ -114,7 +570,16 @@ class SpacyDetector(Detector):
         )
 
     def detect(self, text: str) -> List[EntitySpan]:
-        doc = self.nlp(text)
+        return self._doc_spans(self.nlp(text))
+
+    def detect_batch(self, texts: List[str]) -> List[List[EntitySpan]]:
+        """Run the texts through ``nlp.pipe`` so spaCy batches them."""
+        docs = self.nlp.pipe(
+            texts, batch_size=self.batch_size, n_process=self.n_process
+        )
+        return [self._doc_spans(doc) for doc in docs]
+
+    def _doc_spans(self, doc) -> List[EntitySpan]:
         spans = []
         for ent in doc.ents:
             if ent.label_ in self.pii_labels:
@@ -131,6 +596,50 @@ class SpacyDetector(Detector):
         return spans
 
 
+# None picks bf16/fp16 on a GPU and fp32 on the CPU.
+BERT_PRECISIONS = (None, "fp32", "fp16", "bf16", "int8")
+
+
+def _bert_model_kwargs(torch, precision: Optional[str], on_gpu: bool) -> Dict:
+    """Translate a precision name into ``from_pretrained`` keyword arguments."""
+    if precision is None:
+        if not on_gpu:
+            return {}
+        precision = "bf16" if torch.cuda.is_bf16_supported() else "fp16"
+    if precision == "fp16":
+        return {"torch_dtype": torch.float16}
+    if precision == "bf16":
+        return {"torch_dtype": torch.bfloat16}
+    if precision == "int8":
+        try:
+            import bitsandbytes  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "bitsandbytes is required for precision='int8'. Install it with `pip install bitsandbytes`"
+            )
+        return {"load_in_8bit": True}
+    return {}
+
+
+@lru_cache(maxsize=4)
+def _load_hf_ner(
+    pipeline: Callable, torch, model_name: str, device: int, precision: Optional[str]
+):
+    """Build a transformers NER pipeline once per model, device and precision."""
+    model_kwargs = _bert_model_kwargs(torch, precision, on_gpu=device >= 0)
+    # 8-bit weights are placed by accelerate, which rejects a device too
+    placement = (
+        {"device_map": "auto"} if "load_in_8bit" in model_kwargs else {"device": device}
+    )
+    return pipeline(
+        "ner",
+        model=model_name,
+        aggregation_strategy="simple",
+        model_kwargs=model_kwargs,
+        **placement,
+    )
+
+
 class BertDetector(Detector):
     def __init__(
         self,
@@ -138,7 +647,15 @@ class BertDetector(Detector):
         threshold: float = 0.5,
         label_mapping: Optional[Dict[str, List[str]]] = None,
         device: Optional[int] = None,
+        batch_size: int = 1,
+        max_tokens_per_batch: Optional[int] = None,
+        precision: Optional[str] = None,
     ):
+        if precision not in BERT_PRECISIONS:
+            raise ValueError(
+                f"Unknown precision '{precision}'. Choose from: "
+                f"{', '.join(p for p in BERT_PRECISIONS if p)}"
+            )
         try:
             import torch
             from transformers import pipeline
@@ -191,10 +708,15 @@ class BertDetector(Detector):
         if device is None:
             device = 0 if torch.cuda.is_available() else -1
 
-        self.nlp = pipeline(
-            "ner", model=model_name, aggregation_strategy="simple", device=device
-        )
+        # Shared across detectors; batch sizes are passed per call instead.
+        self.nlp = _load_hf_ner(pipeline, torch, model_name, device, precision)
         self.threshold = threshold
+        # With batch_size > 1, texts are split into sentences that go through
+        # the model together instead of one long sequence.
+        self.batch_size = batch_size
+        # When set, detect_batch sorts inputs by token length and packs them
+        # into batches of at most this many (padded) tokens.
+        self.max_tokens_per_batch = max_tokens_per_batch
         # Default mapping if none provided.
         # dslim/bert-base-NER uses PER, ORG, LOC, MISC
         self.label_mapping = label_mapping or {
@@ -210,7 +732,81 @@ class BertDetector(Detector):
                 self.tag_to_pii[tag] = pii_type
 
     def detect(self, text: str) -> List[EntitySpan]:
-        results = self.nlp(text)
+        if self.batch_size > 1:
+            sentences = split_sentences(text)
+            if len(sentences) > 1:
+                batched = self.nlp(
+                    [sentence for _, sentence in sentences], batch_size=self.batch_size
+                )
+                spans = []
+                for (offset, _), results in zip(sentences, batched):
+                    spans.extend(self._to_spans(results, offset))
+                return spans
+        return self._to_spans(self.nlp(text))
+
+    def detect_batch(self, texts: List[str]) -> List[List[EntitySpan]]:
+        """
+        Run every text through the model in one pipeline call.
+
+        With ``batch_size > 1`` the texts are split into sentences first, and
+        the sentences of all texts are batched together.
+        """
+        if self.batch_size > 1:
+            pieces = [
+                (index, offset, sentence)
+                for index, text in enumerate(texts)
+                for offset, sentence in split_sentences(text)
+            ]
+        else:
+            pieces = [(index, 0, text) for index, text in enumerate(texts) if text]
+
+        spans: List[List[EntitySpan]] = [[] for _ in texts]
+        if not pieces:
+            return spans
+        inputs = [piece for _, _, piece in pieces]
+        if self.max_tokens_per_batch:
+            results = self._run_length_bucketed(inputs)
+        else:
+            results = self.nlp(inputs, batch_size=self.batch_size)
+        for (index, offset, _), result in zip(pieces, results):
+            spans[index].extend(self._to_spans(result, offset))
+        return spans
+
+    def _run_length_bucketed(self, inputs: List[str]) -> List[List[Dict]]:
+        """
+        Run ``inputs`` shortest first in batches of similar length.
+
+        A batch is padded to its longest member, so sorting keeps padding
+        small; each batch grows while ``size * longest`` stays within
+        ``max_tokens_per_batch``. Results come back in input order.
+        """
+        lengths = self.nlp.tokenizer(
+            inputs, add_special_tokens=False, return_length=True
+        )["length"]
+        order = sorted(range(len(inputs)), key=lengths.__getitem__)
+
+        results: List[List[Dict]] = [[] for _ in inputs]
+        batch: List[int] = []
+        for index in order:
+            # Sorted ascending, so the newcomer is the longest in the batch
+            if batch and (len(batch) + 1) * max(lengths[index], 1) > (
+                self.max_tokens_per_batch
+            ):
+                self._run_batch(inputs, batch, results)
+                batch = []
+            batch.append(index)
+        if batch:
+            self._run_batch(inputs, batch, results)
+        return results
+
+    def _run_batch(
+        self, inputs: List[str], batch: List[int], results: List[List[Dict]]
+    ) -> None:
+        outputs = self.nlp([inputs[i] for i in batch], batch_size=len(batch))
+        for index, output in zip(batch, outputs):
+            results[index] = output
+
+    def _to_spans(self, results: List[Dict], offset: int = 0) -> List[EntitySpan]:
         spans = []
         for res in results:
             score = float(res["score"])
@@ -223,8 +819,8 @@ class BertDetector(Detector):
 
             spans.append(
                 EntitySpan(
-                    start=res["start"],
-                    end=res["end"],
+                    start=res["start"] + offset,
+                    end=res["end"] + offset,
                     label=pii_label,
                     score=res["score"],
                     source="bert",
@@ -236,6 +832,14 @@ class BertDetector(Detector):
         return spans
 
 
+# Span sources produced by ML detectors; HybridDetector.prefer weighs them.
+_ML_SOURCES = frozenset(("spacy", "bert"))
+
+
+_START = attrgetter("start")
+_END = attrgetter("end")
+
+
 class HybridDetector(Detector):
     def __init__(
         self, detectors: List[Detector], strategy: str = "union", prefer: str = "ml"
@@ -243,55 +847,92 @@ class HybridDetector(Detector):
         self.detectors = detectors
         self.strategy = strategy
         self.prefer = prefer
+        # Sub-detectors run concurrently: spaCy and torch release the GIL in
+        # native code, so a CPU model and a GPU model overlap.
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def __getstate__(self):
+        # Executors cannot be pickled (e.g. for worker processes)
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
+
+    def close(self) -> None:
+        """Shut down the sub-detector threads. A later call starts new ones."""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def __enter__(self) -> "HybridDetector":
+        return self
+
+    def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        self.close()
+
+    def _run_all(self, method: str, arg) -> List:
+        """Call ``method`` on every sub-detector, in parallel when there are several."""
+        if len(self.detectors) < 2:
+            return [getattr(detector, method)(arg) for detector in self.detectors]
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=len(self.detectors), thread_name_prefix="veildata-hybrid"
+            )
+        futures = [
+            self._pool.submit(getattr(detector, method), arg)
+            for detector in self.detectors
+        ]
+        return [future.result() for future in futures]
 
     def detect(self, text: str) -> List[EntitySpan]:
         all_spans = []
-        for detector in self.detectors:
-            all_spans.extend(detector.detect(text))
+        for spans in self._run_all("detect", text):
+            all_spans.extend(spans)
 
         return self._merge_spans(all_spans)
 
+    def detect_batch(self, texts: List[str]) -> List[List[EntitySpan]]:
+        """Batch each sub-detector over all texts, then merge per text."""
+        per_detector = self._run_all("detect_batch", texts)
+        return [
+            self._merge_spans([span for spans in text_spans for span in spans])
+            for text_spans in zip(*per_detector)
+        ]
+
     def _merge_spans(self, spans: List[EntitySpan]) -> List[EntitySpan]:
         if not spans:
             return []
 
-        # Sort by start position
-        spans.sort(key=lambda x: (x.start, -x.end))  # Longest first if starts match
+        # Sort by start position, longest first if starts match. Two stable
+        # sorts on C-level keys are cheaper than one with a Python key.
+        spans.sort(key=_END, reverse=True)
+        spans.sort(key=_START)
 
         merged = []
+        append = merged.append
+        resolve = self._resolve_conflict
         current_span = spans[0]
+        current_end = current_span.end
 
-        for next_span in spans[1:]:
-            # Check for overlap
-            if next_span.start < current_span.end:
+        for next_span in islice(spans, 1, None):
+            if next_span.start < current_end:
                 # Overlap detected. Resolve conflict.
-                current_span = self._resolve_conflict(current_span, next_span)
+                current_span = resolve(current_span, next_span)
+                current_end = current_span.end
             else:
-                merged.append(current_span)
+                append(current_span)
                 current_span = next_span
+                current_end = next_span.end
 
-        merged.append(current_span)
+        append(current_span)
         return merged
 
     def _resolve_conflict(self, span1: EntitySpan, span2: EntitySpan) -> EntitySpan:
-        # Simple resolution logic for now
-
-        # If one contains the other, keep the larger one?
-        # Or if prefer='ml', keep the ML one?
+        is_span1_ml = span1.source in _ML_SOURCES
+        is_span2_ml = span2.source in _ML_SOURCES
 
-        is_span1_ml = span1.source in ["spacy", "bert"]
-        is_span2_ml = span2.source in ["spacy", "bert"]
-
-        if self.prefer == "ml":
-            if is_span1_ml and not is_span2_ml:
-                return span1
-            if is_span2_ml and not is_span1_ml:
-                return span2
-        elif self.prefer == "rules":
-            if not is_span1_ml and is_span2_ml:
-                return span1
-            if not is_span2_ml and is_span1_ml:
-                return span2
+        # A preference only applies between an ML span and a rules span
+        if is_span1_ml is not is_span2_ml and self.prefer in ("ml", "rules"):
+            return span1 if is_span1_ml is (self.prefer == "ml") else span2
 
         # Default: Keep the one with higher score, or longer length if scores equal
         if span1.score > span2.score:
@@ -302,3 +943,94 @@ class HybridDetector(Detector):
         if (span1.end - span1.start) >= (span2.end - span2.start):
             return span1
         return span2
+
+
+_REGEX_COMPONENT = "veildata_regex"
+
+
+def _register_regex_component() -> None:
+    """Register the spaCy factory that runs a RegexDetector inside ``nlp.pipe``."""
+    from spacy.language import Language
+
+    if Language.has_factory(_REGEX_COMPONENT):
+        return
+
+    @Language.factory(_REGEX_COMPONENT, default_config={"patterns": {}, "engine": "re"})
+    def make_regex_component(nlp, name, patterns, engine):
+        detector = RegexDetector(patterns, engine=engine)
+
+        def regex_component(doc):
+            # Plain tuples so the spans survive Doc serialisation (n_process > 1)
+            doc.user_data[_REGEX_COMPONENT] = [
+                (span.start, span.end, span.label, span.text)
+                for span in detector.detect(doc.text)
+            ]
+            return doc
+
+        return regex_component
+
+
+class HybridSpacyDetector(HybridDetector):
+    """
+    spaCy NER and regex patterns detected in a single ``nlp.pipe`` pass.
+
+    The patterns run as a pipeline component over each document's text, so
+    spaCy's batching and ``n_process`` workers cover both detectors. Spans
+    keep their ``spacy``/``regex`` sources and are merged exactly as
+    HybridDetector merges them. ``spacy_detector``'s pipeline is modified, so
+    it should not be shared.
+    """
+
+    def __init__(
+        self,
+        spacy_detector: SpacyDetector,
+        patterns: Dict[str, Union[str, Pattern[str]]],
+        engine: str = "re",
+        strategy: str = "union",
+        prefer: str = "ml",
+    ):
+        sources = self.pattern_sources(patterns)
+        if sources is None:
+            raise ValueError("Pattern flags cannot be passed to the spaCy pipeline")
+        try:
+            _load_regex_engine(engine)
+        except ImportError as e:
+            print(f"[veildata] {e}. Falling back to the 're' engine.", file=sys.stderr)
+            engine = "re"
+
+        super().__init__([spacy_detector], strategy=strategy, prefer=prefer)
+        self.spacy = spacy_detector
+        _register_regex_component()
+        spacy_detector.nlp.add_pipe(
+            _REGEX_COMPONENT, last=True, config={"patterns": sources, "engine": engine}
+        )
+
+    @staticmethod
+    def pattern_sources(
+        patterns: Dict[str, Union[str, Pattern[str]]],
+    ) -> Optional[Dict[str, str]]:
+        """Return the patterns as strings for the pipeline config, or None if
+        a compiled pattern's flags cannot be written inline."""
+        sources = {label: _pattern_source(pat) for label, pat in patterns.items()}
+        if any(source is None for source in sources.values()):
+            return None
+        return sources
+
+    def detect(self, text: str) -> List[EntitySpan]:
+        return self._doc_spans(self.spacy.nlp(text))
+
+    def detect_batch(self, texts: List[str]) -> List[List[EntitySpan]]:
+        docs = self.spacy.nlp.pipe(
+            texts, batch_size=self.spacy.batch_size, n_process=self.spacy.n_process
+        )
+        return [self._doc_spans(doc) for doc in docs]
+
+    def _doc_spans(self, doc) -> List[EntitySpan]:
+        spans = self.spacy._doc_spans(doc)
+        spans.extend(
+            EntitySpan(
+                start=start, end=end, label=label, score=1.0, source="regex", text=text
+            )
+            for start, end, label, text in doc.user_data.get(_REGEX_COMPONENT, ())
+        )
+        return self._merge_spans(spans)
@@ -2,6 +2,12 @@ import os
 import platform
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, List, Sequence, Tuple
+
+# Upper bound for each external command, so a slow registry cannot hang doctor.
+SUBPROCESS_TIMEOUT = 5
 
 
 def check_python():
@@ -59,7 +65,9 @@ def check_docker():
     if not docker_path:
         return ("Docker", "Not installed", "WARN")
     try:
-        version = subprocess.check_output(["docker", "--version"], text=True).strip()
+        version = subprocess.check_output(
+            ["docker", "--version"], text=True, timeout=SUBPROCESS_TIMEOUT
+        ).strip()
         return ("Docker", version, "OK")
     except Exception as e:
         return ("Docker", f"Error ({e})", "FAIL")
@@ -71,12 +79,35 @@ def check_ghcr():
             ["docker", "manifest", "inspect", "ghcr.io/veildata/veildata:latest"],
             text=True,
             stderr=subprocess.STDOUT,
+            timeout=SUBPROCESS_TIMEOUT,
         )
         return ("GHCR Image", "Pullable", "OK")
     except Exception as e:
         return ("GHCR Image", f"Unavailable ({e})", "WARN")
 
 
+def run_checks(
+    checks: Sequence[Callable[[], Tuple[str, str, str]]], max_workers: int = 8
+) -> List[Tuple[str, str, str]]:
+    """Run independent checks concurrently and return their results in order."""
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(lambda check: check(), checks))
+
+
+def all_checks(list_engines) -> List[Callable[[], Tuple[str, str, str]]]:
+    """The checks run by ``veildata doctor``, in display order."""
+    return [
+        check_python,
+        check_os,
+        check_spacy,
+        check_version,
+        partial(check_engines, list_engines),
+        check_write_permissions,
+        check_docker,
+        check_ghcr,
+    ]
+
+
 def print_error(console, title: str, message: str, suggestion: str = None):
     """
     Print a formatted error message using Rich.
@@ -1,4 +1,7 @@
-from typing import Dict, List, Optional, Tuple
+import json
+import sys
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from veildata.compose import Compose
 from veildata.core import Module
@@ -35,6 +38,47 @@ def _lazy_import(dotted_path: str):
     return getattr(module, cls_name)
 
 
+# Detectors are expensive to build (regex compilation, model loading) but hold
+# no per-run state, so pipelines built from the same settings share them. The
+# detector class is part of each key. This only helps repeated builds within
+# one process (library use, tests); each CLI run starts with an empty cache.
+# Least recently used detectors are dropped past _DETECTOR_CACHE_SIZE so
+# callers cycling through settings don't keep every model alive.
+_DETECTOR_CACHE_SIZE = 8
+_DETECTOR_CACHE: "OrderedDict[Tuple, Any]" = OrderedDict()
+
+
+def _cached_detector(key: Tuple, factory: Callable[[], Any], use_cache: bool):
+    if not use_cache:
+        return factory()
+    detector = _DETECTOR_CACHE.get(key)
+    if detector is None:
+        detector = _DETECTOR_CACHE[key] = factory()
+        if len(_DETECTOR_CACHE) > _DETECTOR_CACHE_SIZE:
+            _DETECTOR_CACHE.popitem(last=False)
+    else:
+        _DETECTOR_CACHE.move_to_end(key)
+    return detector
+
+
+def _patterns_key(patterns) -> Tuple:
+    return tuple(
+        (label, getattr(pat, "pattern", pat), getattr(pat, "flags", 0))
+        for label, pat in patterns.items()
+    )
+
+
+def _build_regex_detector(patterns, regex_engine: str):
+    """Build a RegexDetector, falling back to ``re`` if the backend is missing."""
+    from veildata.detectors import RegexDetector
+
+    try:
+        return RegexDetector(patterns, engine=regex_engine)
+    except ImportError as e:
+        print(f"[veildata] {e}. Falling back to the 're' engine.", file=sys.stderr)
+        return RegexDetector(patterns)
+
+
 def build_redactor(
     method: str = "regex",
     detect_mode: str = "rules",
@@ -42,9 +86,18 @@ def build_redactor(
     ml_config_path: Optional[str] = None,
     verbose: bool = False,
     config: Optional[VeilConfig] = None,
+    regex_engine: str = "re",
+    use_cache: bool = True,
 ) -> Tuple[Module, TokenStore]:
     """
     Factory function to build a redactor based on configuration.
+
+    ``regex_engine`` selects the backend for pattern detection ("re", "re2"
+    or "hyperscan"); an uninstalled backend falls back to "re".
+
+    Detectors are reused across calls with the same settings, while every
+    call gets a fresh pipeline and TokenStore. ``use_cache=False`` rebuilds
+    them and skips the config cache.
     """
 
     def vprint(msg: str):
@@ -55,7 +108,7 @@ def build_redactor(
     if config is None:
         # If config_path is explicitly provided, use it
         # Otherwise load_config will look for defaults
-        config = load_config(config_path, verbose=verbose)
+        config = load_config(config_path, verbose=verbose, use_cache=use_cache)
 
     # Update method from config if not explicitly overridden by CLI (which usually defaults to "regex")
     # Note: CLI handling logic usually passes explicit method args, but we respect config if method is default
@@ -76,18 +129,30 @@ def build_redactor(
     start_patterns = config.get_patterns()
 
     if start_patterns:
+        from veildata.defaults import DEFAULT_COMPILED_PATTERNS, DEFAULT_PATTERNS
         from veildata.detectors import (
             BertDetector,
             HybridDetector,
+            HybridSpacyDetector,
             RegexDetector,
             SpacyDetector,
         )
         from veildata.pipeline import DetectionPipeline
 
+        if start_patterns == DEFAULT_PATTERNS:
+            start_patterns = DEFAULT_COMPILED_PATTERNS
+
         if detect_mode == "rules":
             # Rules mode with patterns from config
-            vprint(f"Loading RegexDetector with {len(start_patterns)} patterns...")
-            detector = RegexDetector(start_patterns)
+            vprint(
+                f"Loading RegexDetector with {len(start_patterns)} patterns "
+                f"({regex_engine} engine)..."
+            )
+            detector = _cached_detector(
+                (RegexDetector, regex_engine, _patterns_key(start_patterns)),
+                lambda: _build_regex_detector(start_patterns, regex_engine),
+                use_cache,
+            )
             return (
                 DetectionPipeline(
                     detector, store=store, redaction_format="[{label}_{counter}]"
@@ -108,29 +173,108 @@ def build_redactor(
             if not spacy_conf.enabled and not bert_conf.enabled and detect_mode == "ml":
                 spacy_conf.enabled = True
 
+            # spaCy + regex only: run the patterns inside the spaCy pipeline
+            # so each text goes through a single nlp.pipe pass.
+            if (
+                detect_mode == "hybrid"
+                and spacy_conf.enabled
+                and not bert_conf.enabled
+                and HybridSpacyDetector.pattern_sources(start_patterns) is not None
+            ):
+                vprint("Loading SpacyDetector with regex patterns in its pipeline...")
+                hybrid_conf = config.options.hybrid
+                detector = _cached_detector(
+                    (
+                        HybridSpacyDetector,
+                        spacy_conf.model,
+                        tuple(spacy_conf.pii_labels or ()),
+                        spacy_conf.use_gpu,
+                        spacy_conf.batch_size,
+                        regex_engine,
+                        _patterns_key(start_patterns),
+                        hybrid_conf.strategy,
+                        hybrid_conf.prefer,
+                    ),
+                    lambda: HybridSpacyDetector(
+                        SpacyDetector(
+                            model=spacy_conf.model,
+                            pii_labels=spacy_conf.pii_labels,
+                            use_gpu=spacy_conf.use_gpu,
+                            batch_size=spacy_conf.batch_size,
+                            shared=False,
+                        ),
+                        start_patterns,
+                        engine=regex_engine,
+                        strategy=hybrid_conf.strategy,
+                        prefer=hybrid_conf.prefer,
+                    ),
+                    use_cache,
+                )
+                return (
+                    DetectionPipeline(
+                        detector, store=store, redaction_format="[{label}_{counter}]"
+                    ),
+                    store,
+                )
+
             if spacy_conf.enabled:
                 vprint("Loading SpacyDetector...")
                 detectors.append(
-                    SpacyDetector(
-                        model=spacy_conf.model,
-                        pii_labels=spacy_conf.pii_labels,
+                    _cached_detector(
+                        (
+                            SpacyDetector,
+                            spacy_conf.model,
+                            tuple(spacy_conf.pii_labels or ()),
+                            spacy_conf.use_gpu,
+                            spacy_conf.batch_size,
+                        ),
+                        lambda: SpacyDetector(
+                            model=spacy_conf.model,
+                            pii_labels=spacy_conf.pii_labels,
+                            use_gpu=spacy_conf.use_gpu,
+                            batch_size=spacy_conf.batch_size,
+                        ),
+                        use_cache,
                     )
                 )
 
             if bert_conf.enabled:
                 vprint("Loading BertDetector...")
                 detectors.append(
-                    BertDetector(
-                        model_name=bert_conf.model_path,
-                        threshold=bert_conf.threshold,
-                        label_mapping=bert_conf.label_mapping,
+                    _cached_detector(
+                        (
+                            BertDetector,
+                            bert_conf.model_path,
+                            bert_conf.threshold,
+                            json.dumps(bert_conf.label_mapping, sort_keys=True),
+                            bert_conf.batch_size,
+                            bert_conf.device,
+                            bert_conf.max_tokens_per_batch,
+                            bert_conf.precision,
+                        ),
+                        lambda: BertDetector(
+                            model_name=bert_conf.model_path,
+                            threshold=bert_conf.threshold,
+                            label_mapping=bert_conf.label_mapping,
+                            device=bert_conf.device,
+                            batch_size=bert_conf.batch_size,
+                            max_tokens_per_batch=bert_conf.max_tokens_per_batch,
+                            precision=bert_conf.precision,
+                        ),
+                        use_cache,
                     )
                 )
 
             # 2. Add Regex Detector for Hybrid mode
             if detect_mode == "hybrid":
                 vprint("Loading RegexDetector for Hybrid mode...")
-                detectors.append(RegexDetector(start_patterns))
+                detectors.append(
+                    _cached_detector(
+                        (RegexDetector, regex_engine, _patterns_key(start_patterns)),
+                        lambda: _build_regex_detector(start_patterns, regex_engine),
+                        use_cache,
+                    )
+                )
 
             if not detectors:
                 raise ValueError("No detectors enabled for ML/Hybrid mode.")
@@ -178,6 +322,16 @@ def build_redactor(
     cls = _lazy_import(cls_path)
     vprint(f"Loading redactor: {method}")
 
+    if method == "ner_bert":
+        redactor_config["batch_size"] = config.ml.bert.batch_size
+        # On the CPU, int8 means dynamic quantization of the Linear layers
+        redactor_config["quantize"] = config.ml.bert.precision == "int8"
+        redactor_config["optimize"] = config.ml.bert.optimize
+    elif method == "ner_spacy":
+        redactor_config["use_gpu"] = config.ml.spacy.use_gpu
+        if config.ml.spacy.batch_size:
+            redactor_config["batch_size"] = config.ml.spacy.batch_size
+
     redactor = cls(store=store, **redactor_config)
     return Compose([redactor]), store
 
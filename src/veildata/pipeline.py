@@ -1,8 +1,56 @@
-from typing import Dict, Optional
+import multiprocessing
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 
 from veildata.core import Module
-from veildata.detectors import Detector
-from veildata.revealers import TokenStore
+from veildata.detectors import _START, Detector, EntitySpan, RegexDetector
+from veildata.revealers import TokenStore, _token_formatter
+
+# Detector installed in each worker process by _init_detector_worker.
+_worker_detector: Optional[Detector] = None
+
+
+def _init_detector_worker(detector: Detector) -> None:
+    global _worker_detector
+    _worker_detector = detector
+
+
+def _detect_in_worker(text: str) -> List[EntitySpan]:
+    return _worker_detector.detect(text)
+
+
+def _non_overlapping(spans: List[EntitySpan]) -> List[EntitySpan]:
+    """Sort ``spans`` by start and drop any that overlap an earlier one."""
+    spans.sort(key=_START)
+    kept = []
+    last_end = -1
+    for span in spans:
+        if span.start >= last_end:
+            kept.append(span)
+            last_end = span.end
+    return kept
+
+
+def _iter_pieces(
+    text: str,
+    spans: Iterable[EntitySpan],
+    token_for: Callable[[EntitySpan], str],
+    end: Optional[int] = None,
+) -> Iterator[str]:
+    """
+    Yield ``text[:end]`` in pieces, with each span replaced.
+
+    ``spans`` must be sorted by start. A span overlapping one already
+    replaced is skipped, the same greedy rule as _non_overlapping, so
+    callers that only emit need no filtered copy.
+    """
+    current_idx = 0
+    for span in spans:
+        if span.start < current_idx:
+            continue
+        yield text[current_idx : span.start]
+        yield token_for(span)
+        current_idx = span.end
+    yield text[current_idx:end]
 
 
 class DetectionPipeline(Module):
@@ -30,18 +78,7 @@ class DetectionPipeline(Module):
             Dict with 'original' text and 'detections' list containing metadata
             for each detected span.
         """
-        spans = self.detector.detect(text)
-
-        # Sort spans by start position
-        spans.sort(key=lambda x: x.start)
-
-        # Filter overlapping spans
-        filtered_spans = []
-        last_end = -1
-        for span in spans:
-            if span.start >= last_end:
-                filtered_spans.append(span)
-                last_end = span.end
+        filtered_spans = _non_overlapping(self.detector.detect(text))
 
         detections = []
         for span in filtered_spans:
@@ -61,42 +98,70 @@ class DetectionPipeline(Module):
             "detections": detections,
         }
 
-    def forward(self, text: str) -> str:
-        spans = self.detector.detect(text)
-
-        # Ensure spans are sorted by start
-        spans.sort(key=lambda x: x.start)
-
-        # Filter out overlapping spans if any remain (simple greedy strategy)
-        # HybridDetector should handle this, but good to be safe.
-        filtered_spans = []
-        last_end = -1
-        for span in spans:
-            if span.start >= last_end:
-                filtered_spans.append(span)
-                last_end = span.end
-
-        parts = []
-        current_idx = 0
+    def detect(self, text: str) -> List[EntitySpan]:
+        """Return the detector's spans for ``text`` without redacting."""
+        return self.detector.detect(text)
 
-        for span in filtered_spans:
-            # Append text before the span
-            parts.append(text[current_idx : span.start])
-
-            # Generate redaction token
-            self.counter += 1
-            token = self.redaction_format.format(counter=self.counter, label=span.label)
-
-            # Record in store
-            if self.store:
-                self.store.record(token, span.text)
+    def render_token(self, span: EntitySpan) -> str:
+        """Return the next redaction token for ``span`` and record it."""
+        return self._render(span.label, span.text)
 
-            # Append token
-            parts.append(token)
+    def _render(self, label: str, original: str) -> str:
+        self.counter += 1
+        token = _token_formatter(self.redaction_format)(self.counter, label)
+        if self.store:
+            self.store.record(token, original)
+        return token
 
-            current_idx = span.end
+    def _substitute(self, text: str) -> Optional[str]:
+        """Redact in the regex detector's own scan, skipping EntitySpans and
+        the separate replacement pass. None if the detector cannot."""
+        if isinstance(self.detector, RegexDetector):
+            return self.detector.substitute(text, self._render)
+        return None
 
-        # Append remaining text
-        parts.append(text[current_idx:])
+    def forward(self, text: str) -> str:
+        redacted = self._substitute(text)
+        if redacted is not None:
+            return redacted
+        return self._redact_spans(text, self.detector.detect(text))
+
+    def redact_to(self, text: str, write: Callable[[str], Any]) -> None:
+        """Redact ``text`` into ``write`` piece by piece (e.g. a file's write
+        method), without building the redacted string."""
+        for piece in self._iter_redacted(text, self.detector.detect(text)):
+            write(piece)
+
+    def _redact_spans(self, text: str, spans: List[EntitySpan]) -> str:
+        if not spans:
+            return text  # clean text: no generator, no join
+        return "".join(self._iter_redacted(text, spans))
+
+    def _iter_redacted(self, text: str, spans: List[EntitySpan]) -> Iterator[str]:
+        # HybridDetector already resolves overlaps, but other detectors may
+        # not; _iter_pieces skips overlapping spans as it goes.
+        spans.sort(key=_START)
+        return _iter_pieces(text, spans, self.render_token)
+
+    def forward_many(self, texts: Iterable[str], workers: int = 1) -> List[str]:
+        """
+        Redact a batch of strings, sharing counter and store across them.
 
-        return "".join(parts)
+        Detection goes through ``detector.detect_batch``, so detectors that
+        batch (e.g. spaCy's ``nlp.pipe``) see all texts at once. With
+        ``workers > 1``, detection runs in a process pool while tokens are still numbered and
+        recorded in order on the calling process.
+        """
+        texts = list(texts)
+        if workers > 1:
+            with multiprocessing.Pool(
+                workers,
+                initializer=_init_detector_worker,
+                initargs=(self.detector,),
+            ) as pool:
+                all_spans = pool.map(_detect_in_worker, texts, chunksize=64)
+        else:
+            all_spans = self.detector.detect_batch(texts)
+
+        redact_spans = self._redact_spans
+        return [redact_spans(text, spans) for text, spans in zip(texts, all_spans)]
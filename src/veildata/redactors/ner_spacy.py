@@ -1,5 +1,11 @@
 from veildata.core import Module
-from veildata.revealers import TokenStore
+from veildata.detectors import (
+    SPACY_UNUSED_PIPES,
+    EntitySpan,
+    _activate_spacy_gpu,
+    _load_spacy,
+)
+from veildata.revealers import TokenStore, _token_formatter
 
 try:
     import spacy
@@ -18,9 +24,13 @@ class SpacyNERRedactor(Module):
         entities: list[str] | None = None,
         redaction_token: str = "[REDACTED_{counter}]",
         store: TokenStore | None = None,
+        use_gpu: bool = False,
+        batch_size: int = 128,
     ) -> None:
         super().__init__()
         self.model_name = model
+        self.use_gpu = use_gpu
+        self.batch_size = batch_size
         self.entities = set(entities or ["PERSON", "ORG", "GPE", "EMAIL", "PHONE"])
         self.redaction_token = redaction_token
         self.store = store
@@ -28,8 +38,12 @@ class SpacyNERRedactor(Module):
         self.counter = 0
 
     def _load_model(self) -> None:
+        if self.use_gpu:
+            _activate_spacy_gpu(spacy)
         try:
-            self.nlp = spacy.load(self.model_name, disable=["parser", "tagger"])
+            self.nlp = _load_spacy(
+                spacy.load, self.model_name, tuple(SPACY_UNUSED_PIPES), self.use_gpu
+            )
         except OSError:
             raise RuntimeError(
                 f"spaCy model '{self.model_name}' not found. "
@@ -37,13 +51,54 @@ class SpacyNERRedactor(Module):
             )
 
     def forward(self, text: str) -> str:
-        doc = self.nlp(text)
-        redacted = text
+        return self._redact_doc(text, self.nlp(text))
+
+    def forward_batch(self, texts: list[str]) -> list[str]:
+        """Redact several texts, letting spaCy process them with nlp.pipe."""
+        docs = self.nlp.pipe(texts, batch_size=self.batch_size)
+        return [self._redact_doc(text, doc) for text, doc in zip(texts, docs)]
+
+    def _redact_doc(self, text: str, doc) -> str:
+        # Entities are numbered from the end of the text. Pieces are collected
+        # back to front and joined once, instead of re-slicing the whole
+        # string per entity.
+        parts = []
+        end = len(text)
+        format_token = _token_formatter(self.redaction_token)
         for ent in reversed(doc.ents):
             if ent.label_ in self.entities:
                 self.counter += 1
-                token = self.redaction_token.format(counter=self.counter)
+                token = format_token(self.counter, ent.label_)
                 if self.store:
                     self.store.record(token, ent.text)
-                redacted = redacted[: ent.start_char] + token + redacted[ent.end_char :]
-        return redacted
+                parts.append(text[ent.end_char : end])
+                parts.append(token)
+                end = ent.start_char
+        if not parts:
+            return text
+        parts.append(text[:end])
+        parts.reverse()
+        return "".join(parts)
+
+    def detect(self, text: str) -> list[EntitySpan]:
+        """Return the configured entity types found in ``text`` as spans."""
+        return [
+            EntitySpan(
+                start=ent.start_char,
+                end=ent.end_char,
+                label=ent.label_,
+                score=1.0,
+                source="spacy",
+                text=ent.text,
+            )
+            for ent in self.nlp(text).ents
+            if ent.label_ in self.entities
+        ]
+
+    def render_token(self, span: EntitySpan) -> str:
+        """Return the next redaction token for ``span`` and record it."""
+        self.counter += 1
+        token = _token_formatter(self.redaction_token)(self.counter, span.label)
+        if self.store:
+            self.store.record(token, span.text)
+        return token
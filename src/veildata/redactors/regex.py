@@ -1,31 +1,71 @@
 import re
-from typing import Pattern
+from typing import Dict, List, Pattern, Union
 
 from veildata.core import Module
-from veildata.revealers import TokenStore
+from veildata.detectors import EntitySpan
+from veildata.revealers import TokenStore, _token_formatter
 
 
 class RegexRedactor(Module):
-    """Redact substrings in text using a regex pattern, optionally tracking reversibility."""
+    """Redact substrings in text using a regex pattern, optionally tracking reversibility.
+
+    ``pattern`` may also be a mapping of label -> pattern. The patterns are then
+    joined into one alternation so the text is scanned in a single ``sub`` pass,
+    and ``{label}`` can be used in ``redaction_token``.
+    """
 
     def __init__(
         self,
-        pattern: str,
+        pattern: Union[str, Dict[str, str]],
         redaction_token: str = "[REDACTED_{counter}]",
         store: TokenStore | None = None,
     ) -> None:
         super().__init__()
+        if isinstance(pattern, dict):
+            # Generated group names keep any label usable, e.g. "E-MAIL".
+            self._group_labels = {f"_{i}": label for i, label in enumerate(pattern)}
+            pattern = "|".join(
+                f"(?P<_{i}>{pat})" for i, pat in enumerate(pattern.values())
+            )
+        else:
+            self._group_labels = {}
         self.pattern: Pattern[str] = re.compile(pattern)
         self.redaction_token = redaction_token
         self.store = store
         self.counter = 0
 
     def forward(self, text: str) -> str:
+        group_labels = self._group_labels
+        format_token = _token_formatter(self.redaction_token)
+
         def _replace(match):
             self.counter += 1
-            token = self.redaction_token.format(counter=self.counter)
+            token = format_token(self.counter, group_labels.get(match.lastgroup))
             if self.store:
                 self.store.record(token, match.group(0))
             return token
 
         return self.pattern.sub(_replace, text)
+
+    def detect(self, text: str) -> List[EntitySpan]:
+        """Return every match as a span, labelled by its pattern when known."""
+        group_labels = self._group_labels
+        return [
+            EntitySpan(
+                start=match.start(),
+                end=match.end(),
+                label=group_labels.get(match.lastgroup),
+                score=1.0,
+                source="regex",
+                text=match.group(0),
+            )
+            for match in self.pattern.finditer(text)
+        ]
+
+    def render_token(self, span: EntitySpan) -> str:
+        """Return the next redaction token for ``span`` and record it."""
+        self.counter += 1
+        token = _token_formatter(self.redaction_token)(self.counter, span.label)
+        if self.store:
+            self.store.record(token, span.text)
+        return token
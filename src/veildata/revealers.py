@@ -1,6 +1,34 @@
-import json
+import re
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict
+from string import Formatter
+from typing import Callable, Dict, Optional
+
+from veildata.utils import jsonio
+
+
+@lru_cache(maxsize=32)
+def _token_formatter(template: str) -> Callable[[int, Optional[str]], str]:
+    """
+    Return ``f(counter, label)`` equal to ``template.format(counter=, label=)``.
+
+    Templates whose only field is a plain ``{counter}`` (the default
+    ``[REDACTED_{counter}]``) are split once into prefix and suffix, so each
+    token is an f-string instead of a ``str.format`` parse.
+    """
+    try:
+        fields = list(Formatter().parse(template))
+    except ValueError:
+        fields = []
+    if (
+        fields
+        and fields[0][1:] == ("counter", "", None)
+        and all(field is None for _, field, _, _ in fields[1:])
+    ):
+        prefix = fields[0][0]
+        suffix = "".join(literal for literal, _, _, _ in fields[1:])
+        return lambda counter, label: f"{prefix}{counter}{suffix}"
+    return lambda counter, label: template.format(counter=counter, label=label)
 
 
 class TokenStore:
@@ -15,24 +43,69 @@ class TokenStore:
 
     def __init__(self) -> None:
         self._mapping: Dict[str, str] = {}
+        # Built on the first reveal() after the mapping changes
+        self._revealer: Optional[Callable[[str], str]] = None
 
     def record(self, token: str, original: str) -> None:
         """Record a mapping between a redacted token and its original value."""
         self._mapping[token] = original
+        self._revealer = None
 
     def bulk_record(self, mappings: Dict[str, str]) -> None:
         """Add multiple mappings at once."""
         self._mapping.update(mappings)
+        self._revealer = None
 
     def reveal(self, text: str) -> str:
-        """Replace all stored tokens with their original values in text."""
-        for token, original in self._mapping.items():
-            text = text.replace(token, original)
-        return text
+        """
+        Replace all stored tokens with their original values in text.
+
+        Tokens are found in one left-to-right pass, longest token first where
+        several start at the same position. Revealed values are not scanned
+        again, so a value that looks like a token is left as is.
+        """
+        if self._revealer is None:
+            self._revealer = self._build_revealer()
+        return self._revealer(text)
+
+    def _build_revealer(self) -> Callable[[str], str]:
+        mapping = self._mapping
+        tokens = [token for token in mapping if token]
+        if not tokens:
+            return str
+        try:
+            import ahocorasick
+        except ImportError:
+            # Longest first, so a token that prefixes another cannot win
+            tokens.sort(key=len, reverse=True)
+            pattern = re.compile("|".join(map(re.escape, tokens)))
+            return partial(pattern.sub, lambda match: mapping[match.group()])
+
+        # Aho-Corasick stays linear in the text however many tokens there are
+        automaton = ahocorasick.Automaton()
+        for token in tokens:
+            automaton.add_word(token, token)
+        automaton.make_automaton()
+
+        def reveal(text: str) -> str:
+            parts = []
+            last = 0
+            for end, token in automaton.iter_long(text):
+                start = end - len(token) + 1
+                parts.append(text[last:start])
+                parts.append(mapping[token])
+                last = end + 1
+            if not parts:
+                return text
+            parts.append(text[last:])
+            return "".join(parts)
+
+        return reveal
 
     def clear(self) -> None:
         """Reset the store."""
         self._mapping.clear()
+        self._revealer = None
 
     @property
     def mappings(self) -> Dict[str, str]:
@@ -40,10 +113,10 @@ class TokenStore:
         return dict(self._mapping)
 
     def save(self, path: str):
-        Path(path).write_text(json.dumps(self.mappings, indent=2))
+        Path(path).write_text(jsonio.dumps_indented(self._mapping), encoding="utf-8")
 
     @classmethod
     def load(cls, path: str):
         store = cls()
-        store._mapping = json.loads(Path(path).read_text())
+        store._mapping = jsonio.loads(Path(path).read_bytes())
         return store
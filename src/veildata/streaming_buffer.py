@@ -5,14 +5,37 @@ This module provides a buffer that can process text in chunks while correctly
 detecting and redacting entities that span across chunk boundaries.
 """
 
+import codecs
+import multiprocessing
+import sys
+from collections import deque
 from dataclasses import dataclass
-from typing import Generator, List, Optional
-
-from veildata.pipeline import DetectionPipeline
-from veildata.revealers import TokenStore
-
-
-@dataclass
+from typing import (
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from veildata.detectors import _START, EntitySpan
+from veildata.pipeline import (
+    DetectionPipeline,
+    _detect_in_worker,
+    _init_detector_worker,
+    _iter_pieces,
+    _non_overlapping,
+)
+from veildata.revealers import TokenStore, _token_formatter
+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class ChunkMetadata:
     """Metadata about a processed chunk for debugging and tracking."""
 
@@ -47,6 +70,14 @@ class StreamingRedactionBuffer:
         overlap_size: Number of characters to retain between chunks for boundary detection
         store: Optional TokenStore to record redacted mappings
         redaction_format: Format string for redaction tokens (default: "[REDACTED_{counter}]")
+        encoding: Encoding used to decode chunks passed in as bytes (default: "utf-8")
+        min_scan_size: Defer detection until at least this many characters
+            beyond the overlap are buffered. Each scan re-reads the overlap, so
+            with chunks much smaller than ``overlap_size`` a value around
+            ``overlap_size`` keeps detection linear in the input (default: 0,
+            scan on every chunk)
+        metadata_history: Number of most recent ChunkMetadata records kept
+            for get_metadata(), or None to keep all (default: 1024)
     """
 
     def __init__(
@@ -55,14 +86,23 @@ class StreamingRedactionBuffer:
         overlap_size: int = 512,
         store: Optional[TokenStore] = None,
         redaction_format: str = "[REDACTED_{counter}]",
+        encoding: str = "utf-8",
+        min_scan_size: int = 0,
+        metadata_history: Optional[int] = 1024,
     ):
         if overlap_size < 0:
             raise ValueError("overlap_size must be non-negative")
+        if min_scan_size < 0:
+            raise ValueError("min_scan_size must be non-negative")
 
         self.pipeline = pipeline
         self.overlap_size = overlap_size
         self.store = store or pipeline.store
         self.redaction_format = redaction_format
+        self.min_scan_size = min_scan_size
+        # Bytes chunks are decoded incrementally so multi-byte characters split
+        # across chunk boundaries are carried over instead of corrupted.
+        self._decoder = codecs.getincrementaldecoder(encoding)()
 
         # Internal state
         self._buffer = ""
@@ -70,13 +110,14 @@ class StreamingRedactionBuffer:
         self._counter = 0
         self._total_input_chars = 0
         self._total_output_chars = 0
-        self._chunk_metadata: List[ChunkMetadata] = []
+        # Bounded so long-running streams do not grow without limit
+        self._chunk_metadata: Deque[ChunkMetadata] = deque(maxlen=metadata_history)
 
         # Track the absolute position in the original stream
         # This helps us map detected entities back to their original positions
         self._buffer_start_pos = 0
 
-    def add_chunk(self, chunk: str) -> str:
+    def add_chunk(self, chunk: Union[str, bytes]) -> str:
         """
         Add a chunk of text and return the redacted output for the safe zone.
 
@@ -84,11 +125,14 @@ class StreamingRedactionBuffer:
         contain any entities that might continue in the next chunk.
 
         Args:
-            chunk: New text chunk to process
+            chunk: New text chunk to process, as str or raw bytes (e.g. read
+                from a file opened in binary mode)
 
         Returns:
             Redacted text for the safe portion of the buffer
         """
+        if not isinstance(chunk, str):
+            chunk = self._decoder.decode(chunk)
         if not chunk:
             return ""
 
@@ -96,8 +140,9 @@ class StreamingRedactionBuffer:
         self._buffer += chunk
         self._total_input_chars += len(chunk)
 
-        # If buffer is smaller than overlap, we can't safely process anything yet
-        if len(self._buffer) <= self.overlap_size:
+        # If buffer is smaller than overlap, we can't safely process anything
+        # yet; with min_scan_size, wait until a scan would emit enough text
+        if len(self._buffer) - self.overlap_size < max(self.min_scan_size, 1):
             self._chunk_index += 1
             return ""
 
@@ -108,14 +153,7 @@ class StreamingRedactionBuffer:
         # This ensures entities spanning the boundary are detected
         all_spans = self.pipeline.detector.detect(self._buffer)
 
-        # Sort and filter overlapping spans
-        all_spans.sort(key=lambda x: x.start)
-        filtered_spans = []
-        last_end = -1
-        for span in all_spans:
-            if span.start >= last_end:
-                filtered_spans.append(span)
-                last_end = span.end
+        filtered_spans = _non_overlapping(all_spans)
 
         # Find any entities that cross the safe boundary
         # If an entity crosses into the overlap, we need to adjust safe_end
@@ -131,30 +169,15 @@ class StreamingRedactionBuffer:
         # Separate spans into safe zone (using actual_safe_end)
         safe_spans = [s for s in filtered_spans if s.end <= actual_safe_end]
 
-        # Build redacted output for safe zone only
-        parts = []
-        current_idx = 0
-
-        for span in safe_spans:
-            # Append text before the span
-            parts.append(self._buffer[current_idx : span.start])
-
-            # Generate redaction token
-            self._counter += 1
-            token = self.redaction_format.format(counter=self._counter)
-
-            # Record in store
-            if self.store:
-                self.store.record(token, span.text)
-
-            # Append token
-            parts.append(token)
-            current_idx = span.end
-
-        # Append remaining safe text (up to actual_safe_end)
-        parts.append(self._buffer[current_idx:actual_safe_end])
-
-        redacted_safe = "".join(parts)
+        if safe_spans:
+            redacted_safe = "".join(
+                _iter_pieces(
+                    self._buffer, safe_spans, self._render_token, actual_safe_end
+                )
+            )
+        else:
+            # Clean stretch of the stream: pass the slice through
+            redacted_safe = self._buffer[:actual_safe_end]
 
         # Keep everything from actual_safe_end onward for the next iteration
         self._buffer = self._buffer[actual_safe_end:]
@@ -186,45 +209,21 @@ class StreamingRedactionBuffer:
         Returns:
             Redacted text for the remaining buffer contents
         """
+        # Flush any incomplete trailing bytes left in the decoder
+        self._buffer += self._decoder.decode(b"", final=True)
         if not self._buffer:
             return ""
 
         # Process all remaining text
         spans = self.pipeline.detector.detect(self._buffer)
 
-        # Sort and filter overlapping spans
-        spans.sort(key=lambda x: x.start)
-        filtered_spans = []
-        last_end = -1
-        for span in spans:
-            if span.start >= last_end:
-                filtered_spans.append(span)
-                last_end = span.end
-
-        # Build redacted output
-        parts = []
-        current_idx = 0
-
-        for span in filtered_spans:
-            # Append text before the span
-            parts.append(self._buffer[current_idx : span.start])
-
-            # Generate redaction token
-            self._counter += 1
-            token = self.redaction_format.format(counter=self._counter)
-
-            # Record in store
-            if self.store:
-                self.store.record(token, span.text)
-
-            # Append token
-            parts.append(token)
-            current_idx = span.end
-
-        # Append remaining text
-        parts.append(self._buffer[current_idx:])
-
-        redacted_remaining = "".join(parts)
+        if spans:
+            spans.sort(key=_START)
+            redacted_remaining = "".join(
+                _iter_pieces(self._buffer, spans, self._render_token)
+            )
+        else:
+            redacted_remaining = self._buffer
 
         # Update stats
         self._total_output_chars += len(redacted_remaining)
@@ -234,12 +233,20 @@ class StreamingRedactionBuffer:
 
         return redacted_remaining
 
+    def _render_token(self, span: EntitySpan) -> str:
+        """Return the next redaction token for ``span`` and record it."""
+        self._counter += 1
+        token = _token_formatter(self.redaction_format)(self._counter, span.label)
+        if self.store:
+            self.store.record(token, span.text)
+        return token
+
     def get_metadata(self) -> List[ChunkMetadata]:
         """
-        Get metadata about all processed chunks.
+        Get metadata about processed chunks (the last ``metadata_history``).
 
         Returns:
-            List of ChunkMetadata objects
+            List of ChunkMetadata objects, oldest first
         """
         return list(self._chunk_metadata)
 
@@ -272,15 +279,17 @@ class StreamingRedactionBuffer:
         self._total_output_chars = 0
         self._chunk_metadata.clear()
         self._buffer_start_pos = 0
+        self._decoder.reset()
         if self.store:
             self.store.clear()
 
 
 def stream_redact(
-    chunks: Generator[str, None, None],
+    chunks: Generator[Union[str, bytes], None, None],
     pipeline: DetectionPipeline,
     overlap_size: int = 512,
     store: Optional[TokenStore] = None,
+    workers: int = 1,
 ) -> Generator[str, None, None]:
     """
     Convenience function for streaming redaction.
@@ -288,10 +297,14 @@ def stream_redact(
     This is a simple wrapper around StreamingRedactionBuffer for common use cases.
 
     Args:
-        chunks: Generator yielding text chunks
+        chunks: Generator yielding text chunks (str, or bytes decoded as UTF-8)
         pipeline: DetectionPipeline to use for entity detection
         overlap_size: Number of characters to retain between chunks
         store: Optional TokenStore to record redacted mappings
+        workers: Number of processes running detection in parallel. With
+            more than one worker, chunks are coalesced into segments of at
+            least ``overlap_size`` characters, scanned in a process pool and
+            stitched back together in order on the calling process.
 
     Yields:
         Redacted text chunks
@@ -310,7 +323,17 @@ def stream_redact(
         >>> for redacted_chunk in stream_redact(read_file_chunks("input.txt"), redactor):
         ...     print(redacted_chunk, end="")
     """
-    buffer = StreamingRedactionBuffer(pipeline, overlap_size, store)
+    if workers > 1:
+        yield from _stream_redact_parallel(
+            chunks, pipeline, overlap_size, store, workers
+        )
+        return
+
+    # Only the concatenated output matters here, so scan at most about twice
+    # per overlap_size of input however small the chunks are.
+    buffer = StreamingRedactionBuffer(
+        pipeline, overlap_size, store, min_scan_size=overlap_size
+    )
 
     for chunk in chunks:
         output = buffer.add_chunk(chunk)
@@ -321,3 +344,111 @@ def stream_redact(
     final_output = buffer.finalize()
     if final_output:
         yield final_output
+
+
+def _detect_window(
+    job: Tuple[int, str, int, int],
+) -> Tuple[int, List[EntitySpan]]:
+    """Detect spans starting inside ``window[lo:hi]``, relative to ``lo``."""
+    seq, window, lo, hi = job
+    spans = [
+        EntitySpan(
+            start=span.start - lo,
+            end=span.end - lo,
+            label=span.label,
+            score=span.score,
+            source=span.source,
+            text=span.text,
+        )
+        for span in _detect_in_worker(window)
+        if lo <= span.start < hi
+    ]
+    spans.sort(key=lambda x: x.start)
+    return seq, spans
+
+
+def _segments(chunks: Iterable[Union[str, bytes]], min_size: int) -> Iterator[str]:
+    """Decode chunks and coalesce them into segments of at least ``min_size``."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    pending: List[str] = []
+    size = 0
+    for chunk in chunks:
+        if not isinstance(chunk, str):
+            chunk = decoder.decode(chunk)
+        if not chunk:
+            continue
+        pending.append(chunk)
+        size += len(chunk)
+        if size >= min_size:
+            yield "".join(pending)
+            pending = []
+            size = 0
+    pending.append(decoder.decode(b"", final=True))
+    remaining = "".join(pending)
+    if remaining:
+        yield remaining
+
+
+def _stream_redact_parallel(
+    chunks: Iterable[Union[str, bytes]],
+    pipeline: DetectionPipeline,
+    overlap_size: int,
+    store: Optional[TokenStore],
+    workers: int,
+    redaction_format: str = "[REDACTED_{counter}]",
+) -> Generator[str, None, None]:
+    """
+    Run detection for each segment in a process pool.
+
+    Every segment is scanned together with ``overlap_size`` characters of its
+    neighbours, and owns the spans that start inside it. Token numbering, the
+    TokenStore and overlap stitching stay on the calling process.
+    """
+    if overlap_size < 0:
+        raise ValueError("overlap_size must be non-negative")
+
+    store = store or pipeline.store
+    texts: Dict[int, str] = {}
+
+    def windows() -> Iterator[Tuple[int, str, int, int]]:
+        segments = _segments(chunks, max(overlap_size, 1))
+        current = next(segments, None)
+        tail = ""
+        seq = 0
+        while current is not None:
+            following = next(segments, None)
+            head = following[:overlap_size] if following else ""
+            texts[seq] = current
+            yield seq, tail + current + head, len(tail), len(tail) + len(current)
+            tail = current[len(current) - overlap_size :] if overlap_size else ""
+            current = following
+            seq += 1
+
+    counter = 0
+    format_token = _token_formatter(redaction_format)
+    # Characters at the start of the next segment already covered by a span
+    # that began in the previous one.
+    carry = 0
+    with multiprocessing.Pool(
+        workers, initializer=_init_detector_worker, initargs=(pipeline.detector,)
+    ) as pool:
+        for seq, spans in pool.imap(_detect_window, windows()):
+            segment = texts.pop(seq)
+            parts = []
+            current_idx = carry
+            for span in spans:
+                if span.start < current_idx:
+                    continue
+                parts.append(segment[current_idx : span.start])
+                counter += 1
+                token = format_token(counter, span.label)
+                if store:
+                    store.record(token, span.text)
+                parts.append(token)
+                current_idx = span.end
+            parts.append(segment[current_idx:])
+            carry = max(current_idx - len(segment), 0)
+
+            output = "".join(parts)
+            if output:
+                yield output
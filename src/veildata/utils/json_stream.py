@@ -0,0 +1,103 @@
+"""Incremental JSON redaction for documents too large to load at once."""
+
+import json
+from typing import IO, Callable, Iterator, List, Optional, Union
+
+from veildata.core.config import RuntimeTraversal, TraversalConfig
+
+_INDENT = "  "
+
+
+def iter_redacted_json(
+    source: IO[bytes],
+    redactor_func: Callable[[str], str],
+    traversal: Optional[Union[TraversalConfig, RuntimeTraversal]] = None,
+    chunk_size: int = 65536,
+) -> Iterator[str]:
+    """
+    Parse ``source`` with ijson and yield the redacted document as text.
+
+    Output is formatted like ``json.dumps(indent=2, ensure_ascii=False)``, so
+    it matches the eager ``--json`` path. Only the path from the root to the
+    current value is held in memory.
+
+    Args:
+        source: Binary file object containing a JSON document.
+        redactor_func: A function that takes a string and returns a redacted string.
+        traversal: Optional key rules (see ``RuntimeTraversal.key_decision``).
+            ``keys_to_ignore`` values are never redacted; with the ``allow``
+            policy and a non-empty ``keys_to_redact``, only values under those
+            keys are redacted. The nearest enclosing key decides.
+        chunk_size: Approximate number of characters per yielded piece.
+
+    Raises:
+        ValueError: If the document is malformed.
+    """
+    try:
+        import ijson
+    except ImportError as e:
+        raise ImportError(
+            "ijson is required for streaming JSON redaction. Install it with `pip install veildata[json]`"
+        ) from e
+
+    if traversal is None:
+        traversal = TraversalConfig()
+    if isinstance(traversal, TraversalConfig):
+        traversal = traversal.to_runtime()
+    decide = traversal.key_decision
+
+    # Each frame: [is_map, has_children, redact flag, dotted key path]
+    stack: List[list] = []
+    redact_next = traversal.redact_by_default  # decision for the next value
+    path_next = ""
+    out: List[str] = []
+    size = 0
+    encode = json.dumps
+
+    try:
+        for _, event, value in ijson.parse(source, use_float=True):
+            if event == "map_key":
+                frame = stack[-1]
+                piece = "\n" if not frame[1] else ",\n"
+                frame[1] = True
+                piece += _INDENT * len(stack) + encode(value, ensure_ascii=False) + ": "
+                path_next = f"{frame[3]}.{value}" if frame[3] else value
+                decision = decide(value, path_next)
+                redact_next = frame[2] if decision is None else decision
+            elif event == "end_map" or event == "end_array":
+                frame = stack.pop()
+                closer = "}" if frame[0] else "]"
+                piece = "\n" + _INDENT * len(stack) + closer if frame[1] else closer
+            else:
+                piece = ""
+                if stack and not stack[-1][0]:
+                    # Array element: separator goes before the value
+                    frame = stack[-1]
+                    piece = "\n" if not frame[1] else ",\n"
+                    frame[1] = True
+                    piece += _INDENT * len(stack)
+                    redact_next = frame[2]
+                    path_next = frame[3]
+
+                if event == "start_map":
+                    stack.append([True, False, redact_next, path_next])
+                    piece += "{"
+                elif event == "start_array":
+                    stack.append([False, False, redact_next, path_next])
+                    piece += "["
+                elif event == "string" and redact_next:
+                    piece += encode(redactor_func(value), ensure_ascii=False)
+                else:
+                    piece += encode(value, ensure_ascii=False)
+
+            out.append(piece)
+            size += len(piece)
+            if size >= chunk_size:
+                yield "".join(out)
+                out.clear()
+                size = 0
+    except ijson.JSONError as e:
+        raise ValueError(f"Invalid JSON: {e}") from e
+
+    if out:
+        yield "".join(out)
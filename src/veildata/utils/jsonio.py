@@ -0,0 +1,27 @@
+"""JSON helpers that use orjson when it is installed and fall back to stdlib json."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch this regardless of the backend.
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(text: Union[str, bytes]) -> Any:
+    """Parse a JSON document (bytes are read as UTF-8)."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def dumps_indented(obj: Any) -> str:
+    """Serialise ``obj`` with two-space indentation, keeping non-ASCII text."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2, ensure_ascii=False)
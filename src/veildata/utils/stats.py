@@ -0,0 +1,86 @@
+from typing import List
+
+
+class P2Quantile:
+    """
+    Streaming quantile estimate in constant memory (the P-squared algorithm).
+
+    Five markers track the minimum, the maximum, the target quantile and the
+    two points halfway to it; their heights are adjusted with a piecewise
+    parabolic fit as observations arrive, so nothing is stored or sorted.
+    Until five values have been seen the exact quantile is returned.
+
+    Reference: Jain & Chlamtac, "The P2 algorithm for dynamic calculation of
+    quantiles and histograms without storing observations" (CACM, 1985).
+    """
+
+    def __init__(self, p: float) -> None:
+        if not 0 < p < 1:
+            raise ValueError("p must be between 0 and 1")
+        self.p = p
+        self._heights: List[float] = []
+        self._positions = [1, 2, 3, 4, 5]
+        self._desired = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+        self._increments = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def add(self, x: float) -> None:
+        """Record one observation."""
+        q = self._heights
+        if len(q) < 5:
+            q.append(x)
+            if len(q) == 5:
+                q.sort()
+            return
+
+        # Find the cell holding x, extending the extremes if needed
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+
+        n = self._positions
+        for i in range(k + 1, 5):
+            n[i] += 1
+        desired = self._desired
+        for i in range(5):
+            desired[i] += self._increments[i]
+
+        # Move the middle markers towards their desired positions
+        for i in range(1, 4):
+            d = desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if d > 0 else -1
+                height = self._parabolic(i, step)
+                if not q[i - 1] < height < q[i + 1]:
+                    height = q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+                q[i] = height
+                n[i] += step
+
+    def _parabolic(self, i: int, d: int) -> float:
+        q = self._heights
+        n = self._positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    @property
+    def value(self) -> float:
+        """Return the current estimate."""
+        q = self._heights
+        if not q:
+            raise ValueError("no observations")
+        if len(q) < 5 or self._positions[4] == 5:
+            # Few enough values to answer exactly (linear interpolation)
+            ordered = sorted(q)
+            rank = self.p * (len(ordered) - 1)
+            low = int(rank)
+            high = min(low + 1, len(ordered) - 1)
+            return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+        return q[2]
@@ -1,24 +1,102 @@
-from typing import Any, Callable
+from typing import Any, Callable, Iterator, List, Optional, Tuple, Union
 
+from veildata.core.config import RuntimeTraversal, TraversalConfig
 
-def traverse_and_redact(data: Any, redactor_func: Callable[[str], str]) -> Any:
+
+def traverse_and_redact(
+    data: Any,
+    redactor_func: Callable[[str], str],
+    batch_func: Optional[Callable[[List[str]], List[str]]] = None,
+    traversal: Optional[Union[TraversalConfig, RuntimeTraversal]] = None,
+) -> Any:
     """
-    Recursively traverse a JSON-like structure (dict, list, primitive) and apply
+    Traverse a JSON-like structure (dict, list, primitive) and apply
     redactor_func to all string values.
 
+    The walk uses an explicit stack instead of recursion, so deeply nested
+    documents cost no Python frames per level. Strings are visited in document
+    order, matching a depth-first recursive walk.
+
     Args:
         data: The input data (dict, list, str, int, etc.).
         redactor_func: A function that takes a string and returns a redacted string.
+        batch_func: Optional function that redacts a list of strings at once
+            (e.g. DetectionPipeline.forward_many, or a partial of it with
+            ``workers`` to detect in parallel). When given, every string value
+            is collected in document order and redacted with a single call.
+        traversal: Optional key rules, applied exactly as ``iter_redacted_json``
+            applies them (see ``RuntimeTraversal.key_decision``).
 
     Returns:
         The structure with strings redacted, preserving original structure and types.
     """
-    if isinstance(data, dict):
-        return {k: traverse_and_redact(v, redactor_func) for k, v in data.items()}
-    elif isinstance(data, list):
-        return [traverse_and_redact(item, redactor_func) for item in data]
-    elif isinstance(data, str):
-        return redactor_func(data)
-    else:
+    if traversal is None:
+        traversal = TraversalConfig()
+    if isinstance(traversal, TraversalConfig):
+        traversal = traversal.to_runtime()
+    redact_root = traversal.redact_by_default
+    # Without key rules every value inherits the root decision, so the walk
+    # can skip building dotted paths.
+    decide = (
+        traversal.key_decision
+        if traversal.redact_keys or traversal.ignore_keys
+        else None
+    )
+
+    if isinstance(data, str):
+        return redactor_func(data) if redact_root else data
+    if not isinstance(data, (dict, list)):
         # Preserve int, float, bool, None, etc.
         return data
+
+    root = _copy_container(data)
+    # (container copy, key) of each string awaiting batch_func
+    pending: List[Tuple[Any, Any]] = []
+    # Each frame: (container copy, remaining (key, value) pairs, redact flag,
+    # dotted key path). Assigning to existing keys while iterating items() is
+    # safe because the dict never changes size.
+    stack = [(root, _items(root), redact_root, "")]
+    push = stack.append
+    pop = stack.pop
+
+    while stack:
+        container, items, redact_parent, path_parent = stack[-1]
+        by_key = decide is not None and isinstance(container, dict)
+        redact = redact_parent
+        path = path_parent
+        for key, value in items:
+            if by_key:
+                path = f"{path_parent}.{key}" if path_parent else key
+                decision = decide(key, path)
+                redact = redact_parent if decision is None else decision
+            if isinstance(value, str):
+                if not redact:
+                    continue
+                if batch_func is None:
+                    container[key] = redactor_func(value)
+                else:
+                    pending.append((container, key))
+            elif isinstance(value, (dict, list)):
+                child = _copy_container(value)
+                container[key] = child
+                push((child, _items(child), redact, path))
+                break
+        else:
+            pop()
+
+    if pending:
+        redacted = batch_func([container[key] for container, key in pending])
+        for (container, key), value in zip(pending, redacted):
+            container[key] = value
+
+    return root
+
+
+def _copy_container(container: Any) -> Any:
+    return dict(container) if isinstance(container, dict) else list(container)
+
+
+def _items(container: Any) -> Iterator[Tuple[Any, Any]]:
+    return (
+        iter(container.items()) if isinstance(container, dict) else enumerate(container)
+    )
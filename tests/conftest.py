@@ -1,11 +1,47 @@
-import subprocess
+from importlib.metadata import entry_points
 
 import pytest
 
 
 @pytest.fixture(scope="session")
 def cli_exists():
-    result = subprocess.run(
-        ["uv", "run", "veildata", "--help"], capture_output=True, text=True
+    eps = entry_points()
+    if hasattr(eps, "select"):
+        scripts = eps.select(group="console_scripts", name="veildata")
+    else:  # Python 3.9: dict of group -> entry points
+        scripts = [ep for ep in eps.get("console_scripts", ()) if ep.name == "veildata"]
+    assert scripts, "veildata CLI not found"
+    return next(iter(scripts)).load()
+
+
+@pytest.fixture(autouse=True)
+def isolated_config_cache(tmp_path, monkeypatch):
+    """Keep load_config's on-disk cache out of the real home directory."""
+    monkeypatch.setenv("VEILDATA_CACHE_DIR", str(tmp_path / ".veildata-cache"))
+
+
+# Config files shared by the CLI tests. Written once per session; load_config
+# then serves them from its (path, mtime) cache instead of re-parsing each.
+
+
+@pytest.fixture(scope="session")
+def test_pattern_config_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("cfg") / "config.yaml"
+    path.write_text('patterns:\n  TEST: "test"\n')
+    return path
+
+
+@pytest.fixture(scope="session")
+def phone_config_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("cfg") / "config.yaml"
+    path.write_text('patterns:\n  PHONE: "\\\\b\\\\d{3}-\\\\d{3}-\\\\d{4}\\\\b"\n')
+    return path
+
+
+@pytest.fixture(scope="session")
+def email_config_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("cfg") / "config.yaml"
+    path.write_text(
+        'patterns:\n  EMAIL: "[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\\\.[a-zA-Z]{2,}"\n'
     )
-    assert result.returncode == 0, "veildata CLI not found"
+    return path
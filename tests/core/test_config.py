@@ -7,6 +7,7 @@ from veildata.core.config import (
     RedactionMethod,
     TraversalPolicy,
     VeilConfig,
+    env_overrides,
     load_config,
 )
 from veildata.exceptions import ConfigMissingError
@@ -138,3 +139,85 @@ def test_traversal_config_defaults():
     config = VeilConfig()
     assert config.traversal.max_depth == 100
     assert config.traversal.keys_to_redact == []
+    assert config.traversal.redact_by_default
+
+
+def test_traversal_key_decision():
+    """Key rules match bare keys or dotted paths; ignore wins."""
+    traversal = VeilConfig(
+        traversal={
+            "keys_to_redact": ["password", "address.firstLine"],
+            "keys_to_ignore": ["id"],
+        }
+    ).traversal
+
+    assert not traversal.redact_by_default
+    assert traversal.key_decision("password", "user.password") is True
+    assert traversal.key_decision("firstLine", "address.firstLine") is True
+    assert traversal.key_decision("firstLine", "billing.firstLine") is None
+    assert traversal.key_decision("id", "id") is False
+
+    deny = VeilConfig(
+        traversal={"policy": "deny", "keys_to_redact": ["password"]}
+    ).traversal
+    assert deny.redact_by_default
+    assert deny.key_decision("password", "password") is None
+
+
+def test_to_runtime_snapshot():
+    """The runtime snapshot is frozen and carries compiled patterns."""
+    import dataclasses
+
+    config = VeilConfig(
+        method="hybrid",
+        patterns={"SSN": r"\d{3}-\d{2}-\d{4}"},
+        traversal={"keys_to_redact": ["password"]},
+    )
+    runtime = config.to_runtime()
+
+    assert runtime.method == "hybrid"
+    assert runtime.patterns["SSN"].search("id 123-45-6789")
+    assert runtime.traversal.key_decision("password", "password") is True
+    assert runtime.hybrid_prefer == "ml"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        runtime.method = "regex"
+
+
+def test_load_config_cache(config_file, clean_env, tmp_path, monkeypatch):
+    """Unchanged files are served from the cache; edits invalidate it."""
+    from veildata.core import config as config_module
+
+    monkeypatch.setenv("VEILDATA_CACHE_DIR", str(tmp_path / "cache"))
+    path = config_file("method: regex")
+
+    first = load_config(path)
+    first.patterns = {"MUTATED": "x"}
+    assert load_config(path).patterns is None
+    assert list((tmp_path / "cache").glob("*.pkl"))
+
+    # A fresh process only has the on-disk cache
+    config_module._CONFIG_CACHE.clear()
+    assert load_config(path).method == RedactionMethod.REGEX
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("method: ner_bert\n")
+    assert load_config(path).method == RedactionMethod.NER_BERT
+
+
+def test_env_overrides_snapshot(clean_env, monkeypatch, tmp_path):
+    """Overrides are read once and can be passed in explicitly."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
+
+    assert env_overrides({"VEILDATA_METHOD": "ner_bert", "OTHER": "x"}) == (
+        ("method", "ner_bert"),
+    )
+    assert env_overrides({"VEILDATA_METHOD": ""}) == ()
+
+    first = load_config(None)
+    assert first.method == RedactionMethod.REGEX
+    assert load_config(None) is not first  # cached, but copied
+
+    monkeypatch.setenv("VEILDATA_METHOD", "ner_spacy")
+    assert load_config(None).method == RedactionMethod.NER_SPACY
+    assert load_config(None, overrides=()).method == RedactionMethod.REGEX
@@ -9,14 +9,30 @@ PII_TEMPLATES = [
 ]
 
 
+# Lines per write when there is no delay between them
+BATCH_LINES = 1024
+
+
 def generate_logs(count=10, delay=0.0):
-    for i in range(count):
-        template = random.choice(PII_TEMPLATES)
-        log = template.format(i=i)
-        print(log)
-        sys.stdout.flush()
-        if delay > 0:
+    # One RNG call for all lines instead of random.choice per line
+    templates = random.choices(PII_TEMPLATES, k=count)
+    if delay > 0:
+        # Paced output: one line at a time, flushed so the reader sees it
+        for i, template in enumerate(templates):
+            print(template.format(i=i))
+            sys.stdout.flush()
             time.sleep(delay)
+        return
+
+    batch = []
+    for i, template in enumerate(templates):
+        batch.append(template.format(i=i))
+        if len(batch) >= BATCH_LINES:
+            sys.stdout.write("\n".join(batch) + "\n")
+            batch.clear()
+    if batch:
+        sys.stdout.write("\n".join(batch) + "\n")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -1,8 +1,7 @@
-import subprocess
-import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
 from typer.testing import CliRunner
 
 from veildata.cli import app
@@ -10,89 +9,104 @@ from veildata.exceptions import ConfigMissingError
 
 runner = CliRunner()
 
+# Config files as the wizard (and users) write them
+SPACY_TOML = (
+    b'method = "spacy"\n\n[ml.spacy]\nenabled = true\nmodel = "en_core_web_lg"\n'
+)
+HYBRID_TOML = (
+    b'method = "hybrid"\n\n[ml.spacy]\nenabled = true\nmodel = "en_core_web_lg"\n'
+)
+HYBRID_YAML = (
+    b'method: "hybrid"\nml:\n  spacy:\n    enabled: true\n    model: "en_core_web_sm"\n'
+)
+REGEX_YAML = b'method: "regex"'
+
+
+def _mk_cfg(tmp_path: Path, body: bytes, suffix: str = ".yaml") -> Path:
+    path = tmp_path / f"config{suffix}"
+    path.write_bytes(body)
+    return path
+
+
+@pytest.fixture(scope="module")
+def configs(tmp_path_factory):
+    """Read-only config files, written once for the module."""
+    bodies = {
+        "spacy": (SPACY_TOML, ".toml"),
+        "hybrid": (HYBRID_TOML, ".toml"),
+        "hybrid_yaml": (HYBRID_YAML, ".yaml"),
+        "regex": (REGEX_YAML, ".yaml"),
+    }
+    return {
+        name: _mk_cfg(tmp_path_factory.mktemp(name), body, suffix)
+        for name, (body, suffix) in bodies.items()
+    }
+
+
+@pytest.mark.parametrize(
+    "config_fixture, input_text, token, secret",
+    [
+        (
+            "phone_config_path",
+            "Call me at 555-123-4567 today.",
+            "[PHONE_1]",
+            "555-123-4567",
+        ),
+        (
+            "email_config_path",
+            "Email test@example.com for info.",
+            "[EMAIL_1]",
+            "test@example.com",
+        ),
+    ],
+    ids=["phone", "email"],
+)
+def test_regex_redaction(request, config_fixture, input_text, token, secret):
+    """Test basic regex redaction via CLI."""
+    config_file = request.getfixturevalue(config_fixture)
 
-def run_cli(args):
-    """Helper to run the CLI via subprocess."""
-    cmd = [sys.executable, "-m", "veildata.cli"] + args
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    return result
-
-
-def test_phone_regex_redaction(tmp_path):
-    """Test basic phone number redaction via CLI."""
-    # Create a simple config file
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text(
-        'patterns:\n  PHONE: "\\\\b\\\\d{3}-\\\\d{3}-\\\\d{4}\\\\b"\n'
-    )
-
-    input_text = "Call me at 555-123-4567 today."
-    result = run_cli(
-        ["redact", input_text, "--method", "regex", "--config", str(config_file)]
-    )
-
-    assert result.returncode == 0, f"STDERR: {result.stderr}"
-    assert "[PHONE_1]" in result.stdout
-    assert "555-123-4567" not in result.stdout
-
-
-def test_email_regex_redaction(tmp_path):
-    """Test basic email redaction via CLI."""
-    # Create a simple config file
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text(
-        'patterns:\n  EMAIL: "[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\\\.[a-zA-Z]{2,}"\n'
-    )
-
-    input_text = "Email test@example.com for info."
-    result = run_cli(
-        ["redact", input_text, "--method", "regex", "--config", str(config_file)]
+    result = runner.invoke(
+        app, ["redact", input_text, "--method", "regex", "--config", str(config_file)]
     )
 
-    assert result.returncode == 0, f"STDERR: {result.stderr}"
-    assert "[EMAIL_1]" in result.stdout
-    assert "test@example.com" not in result.stdout
+    assert result.exit_code == 0, result.output
+    assert token in result.stdout
+    assert secret not in result.stdout
 
 
 def test_cli_missing_config():
     """Test that CLI handles missing config file gracefully."""
-    result = run_cli(["redact", "input.txt", "--config", "nonexistent_config.yaml"])
-    assert result.returncode == 1
+    result = runner.invoke(
+        app, ["redact", "input.txt", "--config", "nonexistent_config.yaml"]
+    )
+    assert result.exit_code == 1
     assert "Configuration Error" in result.stdout
 
 
-def test_wizard_spacy_config(tmp_path):
+def test_wizard_spacy_config(configs):
     """Test that wizard-generated spacy config works."""
-    # Create config like wizard would
-    config_file = tmp_path / "config.toml"
-    config_file.write_text(
-        'method = "spacy"\n\n[ml.spacy]\nenabled = true\nmodel = "en_core_web_lg"\n'
-    )
+    config_file = configs["spacy"]
 
     input_text = "Test text"
     # This will fail due to missing model, but should not raise ValueError
-    result = run_cli(["redact", input_text, "--config", str(config_file)])
+    result = runner.invoke(app, ["redact", input_text, "--config", str(config_file)])
 
     # Should fail with model error, not ValueError about unknown method
-    assert "ValueError" not in result.stderr
-    assert "Unknown redaction method" not in result.stderr
+    assert type(result.exception) is not ValueError
+    assert "Unknown redaction method" not in str(result.exception)
 
 
-def test_wizard_hybrid_config(tmp_path):
+def test_wizard_hybrid_config(configs):
     """Test that wizard-generated hybrid config works."""
-    # Create config like wizard would
-    config_file = tmp_path / "config.toml"
-    config_file.write_text(
-        'method = "hybrid"\n\n[ml.spacy]\nenabled = true\nmodel = "en_core_web_lg"\n'
-    )
+    config_file = configs["hybrid"]
 
     input_text = "Test email@example.com"
     # This will fail due to missing spacy model, but should not raise ValueError
-    result = run_cli(["redact", input_text, "--config", str(config_file)])
+    result = runner.invoke(app, ["redact", input_text, "--config", str(config_file)])
 
     # Should fail with model error, not ValueError about unknown method
-    assert "ValueError" not in result.stderr
-    assert "Unknown redaction method" not in result.stderr
+    assert type(result.exception) is not ValueError
+    assert "Unknown redaction method" not in str(result.exception)
 
 
 def test_cli_inspect():
@@ -109,14 +123,14 @@ def test_cli_version():
     assert "VeilData" in result.stdout
 
 
-@patch("veildata.cli.check_python")
-@patch("veildata.cli.check_os")
-@patch("veildata.cli.check_spacy")
-@patch("veildata.cli.check_version")
-@patch("veildata.cli.check_engines")
-@patch("veildata.cli.check_write_permissions")
-@patch("veildata.cli.check_docker")
-@patch("veildata.cli.check_ghcr")
+@patch("veildata.diagnostics.check_python")
+@patch("veildata.diagnostics.check_os")
+@patch("veildata.diagnostics.check_spacy")
+@patch("veildata.diagnostics.check_version")
+@patch("veildata.diagnostics.check_engines")
+@patch("veildata.diagnostics.check_write_permissions")
+@patch("veildata.diagnostics.check_docker")
+@patch("veildata.diagnostics.check_ghcr")
 def test_cli_doctor(
     mock_ghcr,
     mock_docker,
@@ -142,6 +156,23 @@ def test_cli_doctor(
     assert "All checks passed!" in result.stdout
 
 
+def test_run_checks_concurrently_in_order():
+    import threading
+
+    from veildata.diagnostics import run_checks
+
+    # Both checks wait for each other, so this only finishes if they overlap
+    barrier = threading.Barrier(2, timeout=5)
+
+    def check(name):
+        return lambda: (name, str(barrier.wait() >= 0), "OK")
+
+    assert run_checks([check("slow"), check("fast")]) == [
+        ("slow", "True", "OK"),
+        ("fast", "True", "OK"),
+    ]
+
+
 @patch("veildata.wizard.run_wizard")
 def test_cli_init(mock_wizard):
     result = runner.invoke(app, ["init"])
@@ -149,9 +180,8 @@ def test_cli_init(mock_wizard):
     mock_wizard.assert_called_once()
 
 
-def test_cli_redact_preview(tmp_path):
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text('patterns:\n  TEST: "test"\n')
+def test_cli_redact_preview(test_pattern_config_path):
+    config_file = test_pattern_config_path
 
     result = runner.invoke(
         app,
@@ -170,9 +200,8 @@ def test_cli_redact_preview(tmp_path):
     assert "[TEST_1]" in result.stdout
 
 
-def test_cli_redact_explain(tmp_path):
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text('patterns:\n  TEST: "test"\n')
+def test_cli_redact_explain(test_pattern_config_path):
+    config_file = test_pattern_config_path
 
     result = runner.invoke(
         app, ["redact", "this is a test", "--explain", "--config", str(config_file)]
@@ -182,11 +211,10 @@ def test_cli_redact_explain(tmp_path):
     assert '"label": "TEST"' in result.stdout
 
 
-def test_cli_reveal(tmp_path):
+def test_cli_reveal(tmp_path, test_pattern_config_path):
     # First redact and save store
     store_path = tmp_path / "tokens.json"
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text('patterns:\n  TEST: "test"\n')
+    config_file = test_pattern_config_path
 
     redact_result = runner.invoke(
         app,
@@ -232,10 +260,9 @@ def test_cli_benchmark(tmp_path):
     assert "p95_latency_ms" in data
 
 
-def test_cli_redact_with_time(tmp_path):
+def test_cli_redact_with_time(test_pattern_config_path):
     """Test that redact command with --time flag shows timing information."""
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text('patterns:\n  TEST: "test"\n')
+    config_file = test_pattern_config_path
 
     result = runner.invoke(
         app, ["redact", "this is a test", "--time", "--config", str(config_file)]
@@ -248,10 +275,9 @@ def test_cli_redact_with_time(tmp_path):
     assert "ms" in result.stdout
 
 
-def test_cli_redact_with_time_and_output(tmp_path):
+def test_cli_redact_with_time_and_output(tmp_path, test_pattern_config_path):
     """Test that redact command with --time flag works with file output."""
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text('patterns:\n  TEST: "test"\n')
+    config_file = test_pattern_config_path
     output_file = tmp_path / "output.txt"
 
     result = runner.invoke(
@@ -271,10 +297,9 @@ def test_cli_redact_with_time_and_output(tmp_path):
     assert output_file.exists()
 
 
-def test_cli_redact_with_time_dry_run(tmp_path):
+def test_cli_redact_with_time_dry_run(test_pattern_config_path):
     """Test that redact command with --time flag works in dry-run mode."""
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text('patterns:\n  TEST: "test"\n')
+    config_file = test_pattern_config_path
 
     result = runner.invoke(
         app,
@@ -293,12 +318,11 @@ def test_cli_redact_with_time_dry_run(tmp_path):
     assert "Processing:" in result.stdout
 
 
-def test_cli_reveal_with_time(tmp_path):
+def test_cli_reveal_with_time(tmp_path, test_pattern_config_path):
     """Test that reveal command with --time flag shows timing information."""
     # First redact and save store
     store_path = tmp_path / "tokens.json"
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text('patterns:\n  TEST: "test"\n')
+    config_file = test_pattern_config_path
 
     redact_result = runner.invoke(
         app,
@@ -331,10 +355,9 @@ def test_cli_reveal_with_time(tmp_path):
 # ============================================================================
 
 
-def test_basic_redaction_in_process(tmp_path):
+def test_basic_redaction_in_process(test_pattern_config_path):
     """Test basic redaction in-process for coverage."""
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text('patterns:\n  TEST: "test"\n')
+    config_file = test_pattern_config_path
     result = runner.invoke(
         app, ["redact", "this is a test", "--config", str(config_file)]
     )
@@ -342,10 +365,9 @@ def test_basic_redaction_in_process(tmp_path):
     assert "[TEST_1]" in result.stdout
 
 
-def test_stream_basic_in_process(tmp_path):
+def test_stream_basic_in_process(tmp_path, test_pattern_config_path):
     """Test streaming mode in-process."""
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text('patterns:\n  TEST: "test"\n')
+    config_file = test_pattern_config_path
     input_file = tmp_path / "input.txt"
     input_file.write_text("test test test")
     output_file = tmp_path / "output.txt"
@@ -366,6 +388,35 @@ def test_stream_basic_in_process(tmp_path):
     assert output_file.exists()
 
 
+def test_stream_small_chunks_split_multibyte(tmp_path, test_pattern_config_path):
+    """Streaming maps the file and decodes byte chunks across boundaries."""
+    config_file = test_pattern_config_path
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("café test naïve test\n" * 20, encoding="utf-8")
+    output_file = tmp_path / "output.txt"
+
+    result = runner.invoke(
+        app,
+        [
+            "redact",
+            str(input_file),
+            "--stream",
+            "--chunk-size",
+            "3",
+            "--overlap",
+            "8",
+            "--output",
+            str(output_file),
+            "--config",
+            str(config_file),
+        ],
+    )
+    assert result.exit_code == 0
+    output = output_file.read_text(encoding="utf-8")
+    assert output.splitlines()[0] == "café [REDACTED_1] naïve [REDACTED_2]"
+    assert "test" not in output
+
+
 def test_redact_errors_in_process(tmp_path):
     """Test redaction errors in-process."""
     # Missing config handled by load_config exception
@@ -383,9 +434,8 @@ def test_redact_errors_in_process(tmp_path):
     assert result.exit_code == 1
 
 
-def test_redact_file_verbose_in_process(tmp_path):
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text('patterns:\n  TEST: "test"\n')
+def test_redact_file_verbose_in_process(tmp_path, test_pattern_config_path):
+    config_file = test_pattern_config_path
     output_file = tmp_path / "output.txt"
 
     result = runner.invoke(
@@ -405,12 +455,9 @@ def test_redact_file_verbose_in_process(tmp_path):
     assert "written to" in result.stdout or "✅" in result.stdout
 
 
-def test_hybrid_defaults(tmp_path):
+def test_hybrid_defaults(configs):
     """Test hybrid mode falls back to default patterns if none provided."""
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text(
-        'method: "hybrid"\nml:\n  spacy:\n    enabled: true\n    model: "en_core_web_sm"\n'
-    )
+    config_file = configs["hybrid_yaml"]
     with patch("veildata.engine.build_redactor") as mock_build:
         mock_build.return_value = (MagicMock(), MagicMock())
         result = runner.invoke(app, ["redact", "test", "--config", str(config_file)])
@@ -421,10 +468,9 @@ def test_hybrid_defaults(tmp_path):
         assert config_arg.patterns is not None
 
 
-def test_regex_defaults_config(tmp_path):
+def test_regex_defaults_config(configs):
     """Test regex mode defaults if no patterns."""
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text('method: "regex"')
+    config_file = configs["regex"]
 
     with patch("veildata.engine.build_redactor") as mock_build:
         mock_build.return_value = (MagicMock(), MagicMock())
@@ -452,3 +498,37 @@ def test_build_redactor_os_error(mock_build):
     result = runner.invoke(app, ["redact", "test"])
     assert result.exit_code == 1
     assert "Model Error" in result.stdout
+
+
+def test_redact_output_is_plain_text(phone_config_path):
+    """Redacted text is printed verbatim: no markup parsing or line wrapping."""
+    config_file = phone_config_path
+
+    input_text = "[bold]note[/bold] call 555-123-4567 " + "x" * 200
+    result = runner.invoke(app, ["redact", input_text, "--config", str(config_file)])
+
+    assert result.exit_code == 0
+    assert result.stdout == "[bold]note[/bold] call [PHONE_1] " + "x" * 200 + "\n"
+
+
+def test_workers_warning_stays_off_stdout(test_pattern_config_path):
+    """Only the redacted text goes to stdout; the --workers warning does not."""
+    with patch("veildata.engine.build_redactor") as mock_build:
+        mock_build.return_value = (lambda text: "[REDACTED]", None)
+        result = runner.invoke(
+            app,
+            [
+                "redact",
+                "test",
+                "--detect-mode",
+                "ml",
+                "--workers",
+                "2",
+                "--config",
+                str(test_pattern_config_path),
+            ],
+        )
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout == "[REDACTED]\n"
+    assert "--workers only applies to rules mode" in result.stderr
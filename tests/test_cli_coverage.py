@@ -7,11 +7,10 @@ from veildata.cli import app
 runner = CliRunner()
 
 
-def test_cli_pipe(tmp_path):
+def test_cli_pipe(test_pattern_config_path):
     """Test pipe command functionality."""
     # Create a config
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text('patterns:\n  TEST: "test"\n')
+    config_file = test_pattern_config_path
 
     # Mock stdin via input arg
     input_data = "this is a test line\nanother test line"
@@ -24,10 +23,9 @@ def test_cli_pipe(tmp_path):
     assert "[TEST_1]" in result.stdout
 
 
-def test_cli_json_mode(tmp_path):
+def test_cli_json_mode(test_pattern_config_path):
     """Test redaction with --json flag."""
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text('patterns:\n  TEST: "test"\n')
+    config_file = test_pattern_config_path
 
     input_json = '{"key": "this is a test", "nested": ["test item"]}'
 
@@ -165,16 +163,20 @@ def test_cli_wizard_prompt_yes(mock_confirm, mock_wizard):
                 chunk_size=4096,
                 overlap=512,
                 is_json=False,
+                regex_engine="re",
+                workers=1,
+                batch_size=None,
+                gpu=False,
+                no_cache=False,
             )
 
             mock_confirm.assert_called_once()
             mock_wizard.assert_called_once()
 
 
-def test_cli_pipe_error(tmp_path):
+def test_cli_pipe_error(test_pattern_config_path):
     """Test pipe error handling."""
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text('patterns:\n  TEST: "test"\n')
+    config_file = test_pattern_config_path
 
     # Mock redactor to raise exception
     mock_redactor = MagicMock(side_effect=Exception("Stream failure"))
@@ -230,6 +232,11 @@ def test_cli_wizard_prompt_no(mock_confirm, mock_wizard):
                 chunk_size=4096,
                 overlap=512,
                 is_json=False,
+                regex_engine="re",
+                workers=1,
+                batch_size=None,
+                gpu=False,
+                no_cache=False,
             )
 
             mock_confirm.assert_called_once()
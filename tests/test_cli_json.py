@@ -1,3 +1,4 @@
+import pytest
 from typer.testing import CliRunner
 
 from veildata.cli import app
@@ -5,10 +6,9 @@ from veildata.cli import app
 runner = CliRunner()
 
 
-def test_cli_json_redaction(tmp_path):
+def test_cli_json_redaction(tmp_path, test_pattern_config_path):
     """Test JSON redaction via CLI."""
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text('patterns:\n  TEST: "test"\n')
+    config_file = test_pattern_config_path
 
     json_input = '{"key": "this is a test", "items": ["test 1", "test 2"]}'
     input_file = tmp_path / "input.json"
@@ -24,6 +24,31 @@ def test_cli_json_redaction(tmp_path):
     assert '"[TEST_2] 1"' in result.stdout
 
 
+def test_cli_json_redaction_workers(tmp_path, test_pattern_config_path):
+    """Parallel JSON redaction numbers tokens in document order."""
+    config_file = test_pattern_config_path
+
+    input_file = tmp_path / "input.json"
+    input_file.write_text('{"key": "a test", "items": ["test 1", {"n": "test 2"}]}')
+
+    result = runner.invoke(
+        app,
+        [
+            "redact",
+            str(input_file),
+            "--json",
+            "--workers",
+            "2",
+            "--config",
+            str(config_file),
+        ],
+    )
+    assert result.exit_code == 0
+    assert '"key": "a [TEST_1]"' in result.stdout
+    assert '"[TEST_2] 1"' in result.stdout
+    assert '"n": "[TEST_3] 2"' in result.stdout
+
+
 def test_cli_json_invalid(tmp_path):
     """Test invalid JSON input via CLI."""
     result = runner.invoke(
@@ -32,3 +57,34 @@ def test_cli_json_invalid(tmp_path):
     )
     assert result.exit_code == 1
     assert "JSON Error" in result.stdout
+
+
+def test_cli_json_stream_matches_eager(tmp_path, test_pattern_config_path):
+    """--stream --json parses incrementally and writes the same document."""
+    pytest.importorskip("ijson")
+    config_file = test_pattern_config_path
+
+    input_file = tmp_path / "input.json"
+    input_file.write_text('{"key": "a test", "items": ["test 1", {"n": "test 2"}]}')
+
+    args = ["redact", str(input_file), "--json", "--config", str(config_file)]
+    eager = tmp_path / "eager.json"
+    streamed = tmp_path / "streamed.json"
+    assert runner.invoke(app, args + ["--output", str(eager)]).exit_code == 0
+    result = runner.invoke(app, args + ["--stream", "--output", str(streamed)])
+
+    assert result.exit_code == 0
+    streamed_bytes = streamed.read_bytes()
+    assert streamed_bytes == eager.read_bytes()
+    assert b'"n": "[TEST_3] 2"' in streamed_bytes
+
+
+def test_cli_json_stream_invalid(tmp_path):
+    pytest.importorskip("ijson")
+    input_file = tmp_path / "input.json"
+    input_file.write_text('{"key": ')
+
+    result = runner.invoke(app, ["redact", str(input_file), "--json", "--stream"])
+
+    assert result.exit_code == 1
+    assert "JSON Error" in result.stdout
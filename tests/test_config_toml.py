@@ -52,3 +52,15 @@ def test_load_config_no_default(mock_home, tmp_path):
     # load_config returns a default VeilConfig object, not an empty dict
     assert isinstance(config, VeilConfig)
     assert config.method == RedactionMethod.REGEX
+
+
+@patch("pathlib.Path.home")
+def test_load_config_prefers_local_default(mock_home, tmp_path, monkeypatch):
+    """A veildata.* file in the working directory wins over the home config."""
+    mock_home.return_value = tmp_path / "home"
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "veildata.toml").write_text('method = "ner_spacy"')
+
+    config = load_config(None)
+
+    assert config.method == RedactionMethod.NER_SPACY
@@ -42,3 +42,14 @@ def test_forward_not_implemented():
 
     with pytest.raises(NotImplementedError):
         Incomplete().forward("x")
+
+
+def test_package_exports_resolve_lazily():
+    import veildata
+    from veildata.revealers import TokenStore
+
+    assert veildata.TokenStore is TokenStore
+    assert set(veildata.__all__) <= set(dir(veildata))
+
+    with pytest.raises(AttributeError):
+        veildata.DoesNotExist
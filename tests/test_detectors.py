@@ -1,12 +1,18 @@
 import os
+import pickle
+import re
+import sys
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from veildata.defaults import DEFAULT_COMPILED_PATTERNS
 from veildata.detectors import (
     BertDetector,
     EntitySpan,
     HybridDetector,
+    HybridSpacyDetector,
     RegexDetector,
     SpacyDetector,
 )
@@ -25,6 +31,165 @@ def test_regex_detector():
     assert spans[0].end == 24
 
 
+def test_regex_detector_multiple_patterns_single_pass():
+    patterns = {"EMAIL": r"[a-z]+@[a-z]+\.com", "PHONE": r"\d{3}-\d{4}"}
+    detector = RegexDetector(patterns)
+    assert detector._union is not None
+
+    spans = detector.detect("Call 555-1234 or mail a@b.com")
+
+    assert [(s.label, s.text) for s in spans] == [
+        ("PHONE", "555-1234"),
+        ("EMAIL", "a@b.com"),
+    ]
+
+
+def test_regex_detector_numbers_groups_for_non_identifier_labels():
+    patterns = {"E-MAIL": r"[a-z]+@[a-z]+\.com", "PHONE": r"\d{3}-\d{4}"}
+    detector = RegexDetector(patterns)
+    assert detector._union is not None
+
+    spans = detector.detect("Call 555-1234 or mail a@b.com")
+
+    assert [(s.label, s.text) for s in spans] == [
+        ("PHONE", "555-1234"),
+        ("E-MAIL", "a@b.com"),
+    ]
+
+
+def test_regex_detector_accepts_compiled_patterns():
+    email = re.compile(r"[a-z]+@[a-z]+\.com")
+    detector = RegexDetector({"EMAIL": email, "PHONE": r"\d{3}-\d{4}"})
+
+    assert detector.patterns["EMAIL"] is email
+    spans = detector.detect("a@b.com 555-1234")
+    assert [s.label for s in spans] == ["EMAIL", "PHONE"]
+
+
+def test_regex_detector_keeps_flags_of_compiled_patterns():
+    detector = RegexDetector({"WORD": re.compile("secret", re.IGNORECASE), "ID": "id"})
+
+    assert detector._union is not None
+    assert [s.text for s in detector.detect("SECRET data ID id")] == ["SECRET", "id"]
+
+    # Locale/ASCII flags cannot be scoped inline
+    ascii_only = RegexDetector({"WORD": re.compile(r"\w+", re.ASCII)})
+    assert ascii_only._union is None
+    assert [s.text for s in ascii_only.detect("é ab")] == ["ab"]
+
+
+def test_regex_detector_re2_engine():
+    # The stdlib module stands in for google-re2, which shares its API.
+    with patch.dict(sys.modules, {"re2": re}):
+        detector = RegexDetector({"EMAIL": r"[a-z]+@[a-z]+\.com"}, engine="re2")
+
+    spans = detector.detect("Contact test@example.com")
+    assert detector.engine == "re2"
+    assert [s.text for s in spans] == ["test@example.com"]
+
+
+def test_regex_detector_reuses_compiled_union():
+    patterns = {"EMAIL": r"[a-z]+@[a-z]+\.com", "PHONE": r"\d{3}-\d{4}"}
+    with patch.dict(sys.modules, {"re2": re}):
+        first = RegexDetector(patterns, engine="re2")
+        second = RegexDetector(dict(patterns), engine="re2")
+
+    assert first._union is second._union
+    assert first.patterns["EMAIL"] is second.patterns["EMAIL"]
+
+
+class _FakeHyperscanDatabase:
+    """Reports matches the way Hyperscan does: every end offset, SOM leftmost."""
+
+    def __init__(self, mode=None):
+        self.expressions = []
+
+    def compile(self, expressions, ids, elements, flags):
+        self.expressions = list(zip(ids, expressions))
+
+    def scan(self, data, match_event_handler):
+        for pattern_id, expression in self.expressions:
+            for match in re.finditer(expression, data):
+                for end in range(match.start() + 1, match.end() + 1):
+                    match_event_handler(pattern_id, match.start(), end, 0, None)
+
+
+def test_regex_detector_hyperscan_engine():
+    fake_hs = MagicMock(Database=_FakeHyperscanDatabase)
+    with patch.dict(sys.modules, {"hyperscan": fake_hs}):
+        detector = RegexDetector(
+            {"EMAIL": r"[a-z]+@[a-z]+\.com", "PHONE": r"\d{3}-\d{4}"},
+            engine="hyperscan",
+        )
+
+    spans = detector.detect("Call 555-1234 or mail a@b.com")
+    assert [(s.label, s.text, s.start) for s in spans] == [
+        ("PHONE", "555-1234", 5),
+        ("EMAIL", "a@b.com", 22),
+    ]
+
+    # Non-ASCII text is scanned as UTF-8; offsets are converted to characters
+    spans = detector.detect("Café a@b.com, naïve 555-1234")
+    assert [(s.text, s.start, s.end) for s in spans] == [
+        ("a@b.com", 5, 12),
+        ("555-1234", 20, 28),
+    ]
+
+
+def test_regex_detector_hyperscan_default_patterns():
+    pytest.importorskip("hyperscan")
+    # Hyperscan rejects \b in UCP mode; the defaults still compile and agree
+    # with the re engine on ASCII and non-ASCII text.
+    detector = RegexDetector(DEFAULT_COMPILED_PATTERNS, engine="hyperscan")
+    reference = RegexDetector(DEFAULT_COMPILED_PATTERNS)
+    assert detector._hs_db is not None
+
+    for text in (
+        "Mail a@b.com, call 555-123-4567, ssn 123-45-6789 from 10.0.0.1",
+        "Café a@b.com, naïve 555-123-4567",
+    ):
+        assert detector.detect(text) == reference.detect(text)
+
+
+def test_regex_detector_keyword_list_uses_ahocorasick():
+    pytest.importorskip("ahocorasick")
+    names = [f"name{i:03d}" for i in range(100)]
+    patterns = {"NAME": "|".join(["name00", *names]), "EMAIL": r"\S+@\S+"}
+    detector = RegexDetector(patterns)
+    assert detector._automaton is not None
+
+    text = "name001 wrote to a@b.c and name050."
+    spans = detector.detect(text)
+
+    # Same matches as the plain alternation: earliest word wins on ties
+    expected = re.compile(f"(?P<NAME>{patterns['NAME']})|(?P<EMAIL>\\S+@\\S+)")
+    assert [(s.start, s.end, s.label) for s in spans] == [
+        (m.start(), m.end(), m.lastgroup) for m in expected.finditer(text)
+    ]
+    assert [s.text for s in spans] == ["name00", "a@b.c", "name050"]
+
+
+def test_regex_detector_rejects_texts_without_candidates():
+    from veildata.defaults import DEFAULT_COMPILED_PATTERNS
+
+    detector = RegexDetector(DEFAULT_COMPILED_PATTERNS)
+    detector._union = MagicMock(wraps=detector._union)
+
+    assert detector.detect("No contact details here.") == []
+    detector._union.finditer.assert_not_called()
+    assert [s.label for s in detector.detect("call 555-123-4567")] == ["PHONE"]
+
+    restored = pickle.loads(pickle.dumps(RegexDetector(DEFAULT_COMPILED_PATTERNS)))
+    assert restored._candidate is not None
+    # Custom patterns have no known pre-check
+    assert RegexDetector({"WORD": "secret"})._candidate is None
+
+
+def test_regex_detector_unknown_engine():
+    with pytest.raises(ValueError, match="Unknown regex engine"):
+        RegexDetector({"EMAIL": r"x"}, engine="pcre")
+
+
 def test_hybrid_detector_union():
     # Mock detectors
     d1 = MagicMock()
@@ -41,6 +206,217 @@ def test_hybrid_detector_union():
     assert spans[1].text == "a@b.c"
 
 
+def test_hybrid_detector_detect_batch():
+    ml = MagicMock()
+    ml.detect_batch.return_value = [
+        [EntitySpan(0, 4, "PERSON", 0.9, "spacy", "John")],
+        [],
+    ]
+    rules = RegexDetector({"EMAIL": r"\S+@\S+"})
+
+    hybrid = HybridDetector([ml, rules])
+    batches = hybrid.detect_batch(["John a@b.c", "mail x@y.z"])
+
+    ml.detect_batch.assert_called_once_with(["John a@b.c", "mail x@y.z"])
+    assert [[s.text for s in spans] for spans in batches] == [
+        ["John", "a@b.c"],
+        ["x@y.z"],
+    ]
+
+
+def test_hybrid_detector_runs_sub_detectors_concurrently():
+    # Each detector waits for the other; run serially, the barrier times out
+    barrier = threading.Barrier(2, timeout=5)
+
+    def detector(span):
+        d = MagicMock()
+        d.detect.side_effect = lambda text: barrier.wait() is not None and [span]
+        return d
+
+    hybrid = HybridDetector(
+        [
+            detector(EntitySpan(0, 4, "PERSON", 0.9, "spacy", "John")),
+            detector(EntitySpan(5, 10, "EMAIL", 1.0, "regex", "a@b.c")),
+        ]
+    )
+    spans = hybrid.detect("John a@b.c")
+    assert [s.text for s in spans] == ["John", "a@b.c"]
+
+    # The thread pool is dropped on pickling and recreated on first use
+    rules = HybridDetector([RegexDetector({"A": "a"}), RegexDetector({"B": "b"})])
+    rules.detect("ab")
+    restored = pickle.loads(pickle.dumps(rules))
+    assert [s.label for s in restored.detect("ab")] == ["A", "B"]
+
+    # close() shuts the pool down; the context manager closes on exit
+    pool = rules._pool
+    rules.close()
+    assert rules._pool is None and pool._shutdown
+    with restored as detector:
+        detector.detect("ab")
+    assert restored._pool is None
+
+
+def test_spacy_detector_detect_batch_uses_pipe():
+    ent = MagicMock(start_char=0, end_char=4, label_="PERSON", text="John")
+    doc = MagicMock(ents=[ent])
+    detector = SpacyDetector.__new__(SpacyDetector)
+    detector.nlp = MagicMock()
+    detector.nlp.pipe.return_value = iter([doc, MagicMock(ents=[])])
+    detector.pii_labels = {"PERSON"}
+    detector.batch_size = 16
+    detector.n_process = 2
+
+    batches = detector.detect_batch(["John", "nobody"])
+
+    detector.nlp.pipe.assert_called_once_with(
+        ["John", "nobody"], batch_size=16, n_process=2
+    )
+    assert [[s.text for s in spans] for spans in batches] == [["John"], []]
+
+
+@patch("veildata.detectors._register_regex_component")
+def test_hybrid_spacy_detector_single_pass(mock_register):
+    spacy_detector = SpacyDetector.__new__(SpacyDetector)
+    spacy_detector.nlp = MagicMock()
+    spacy_detector.pii_labels = {"PERSON"}
+    spacy_detector.batch_size = 8
+    spacy_detector.n_process = 1
+
+    hybrid = HybridSpacyDetector(
+        spacy_detector, {"EMAIL": re.compile(r"\S+@\S+", re.I)}, prefer="rules"
+    )
+
+    mock_register.assert_called_once_with()
+    spacy_detector.nlp.add_pipe.assert_called_once_with(
+        "veildata_regex",
+        last=True,
+        config={"patterns": {"EMAIL": r"(?i:\S+@\S+)"}, "engine": "re"},
+    )
+
+    # The component leaves regex matches in user_data as plain tuples
+    ent = MagicMock(start_char=0, end_char=4, label_="PERSON", text="John")
+    doc = MagicMock(
+        ents=[ent], user_data={"veildata_regex": [(0, 6, "EMAIL", "John@x")]}
+    )
+    spacy_detector.nlp.pipe.return_value = iter([doc])
+
+    (spans,) = hybrid.detect_batch(["John@x"])
+
+    spacy_detector.nlp.pipe.assert_called_once_with(
+        ["John@x"], batch_size=8, n_process=1
+    )
+    assert [(s.label, s.source) for s in spans] == [("EMAIL", "regex")]
+
+
+def test_hybrid_spacy_detector_rejects_unsupported_flags():
+    assert HybridSpacyDetector.pattern_sources({"A": re.compile("a", re.A)}) is None
+    assert HybridSpacyDetector.pattern_sources({"A": "a"}) == {"A": "a"}
+
+
+def test_load_spacy_is_shared():
+    from veildata.detectors import _load_spacy
+
+    load = MagicMock(side_effect=lambda model, exclude: object())
+    first = _load_spacy(load, "en_core_web_sm", ("parser",), False)
+    assert _load_spacy(load, "en_core_web_sm", ("parser",), False) is first
+    assert _load_spacy(load, "en_core_web_lg", ("parser",), False) is not first
+    assert load.call_count == 2
+    load.assert_called_with("en_core_web_lg", exclude=["parser"])
+
+
+def test_bert_detector_detect_batch_single_call():
+    detector = BertDetector.__new__(BertDetector)
+    detector.threshold = 0.5
+    detector.tag_to_pii = {"PER": "PERSON"}
+    detector.batch_size = 8
+    detector.max_tokens_per_batch = None
+    detector.nlp = MagicMock(
+        return_value=[
+            [
+                {
+                    "entity_group": "PER",
+                    "score": 0.9,
+                    "start": 0,
+                    "end": 4,
+                    "word": "John",
+                }
+            ],
+            [
+                {
+                    "entity_group": "PER",
+                    "score": 0.2,
+                    "start": 0,
+                    "end": 3,
+                    "word": "Amy",
+                }
+            ],
+            [
+                {
+                    "entity_group": "PER",
+                    "score": 0.8,
+                    "start": 0,
+                    "end": 3,
+                    "word": "Bob",
+                }
+            ],
+        ]
+    )
+
+    batches = detector.detect_batch(["John left. Amy stayed.", "", "Bob"])
+
+    detector.nlp.assert_called_once_with(
+        ["John left.", "Amy stayed.", "Bob"], batch_size=8
+    )
+    assert [[(s.text, s.start) for s in spans] for spans in batches] == [
+        [("John", 0)],
+        [],
+        [("Bob", 0)],
+    ]
+
+
+def test_bert_detector_length_bucketed_batches():
+    detector = BertDetector.__new__(BertDetector)
+    detector.threshold = 0.5
+    detector.tag_to_pii = {}
+    detector.batch_size = 1
+    detector.max_tokens_per_batch = 8
+    texts = ["long text here", "a", "bb", "medium"]
+    detector.nlp = MagicMock(
+        side_effect=lambda batch, batch_size: [
+            [{"entity_group": "X", "score": 1.0, "start": 0, "end": 1, "word": t}]
+            for t in batch
+        ]
+    )
+    detector.nlp.tokenizer.return_value = {"length": [6, 1, 2, 3]}
+
+    batches = detector.detect_batch(texts)
+
+    calls = [call.args[0] for call in detector.nlp.call_args_list]
+    # Shortest first; a batch closes once size * longest would exceed 8
+    assert calls == [["a", "bb"], ["medium"], ["long text here"]]
+    assert [spans[0].text for spans in batches] == texts
+
+
+def test_bert_model_kwargs_precision():
+    from types import SimpleNamespace
+
+    from veildata.detectors import _bert_model_kwargs
+
+    cuda = SimpleNamespace(is_bf16_supported=lambda: False)
+    torch = SimpleNamespace(float16="f16", bfloat16="bf16", cuda=cuda)
+
+    assert _bert_model_kwargs(torch, None, on_gpu=False) == {}
+    assert _bert_model_kwargs(torch, None, on_gpu=True) == {"torch_dtype": "f16"}
+    cuda.is_bf16_supported = lambda: True
+    assert _bert_model_kwargs(torch, None, on_gpu=True) == {"torch_dtype": "bf16"}
+    assert _bert_model_kwargs(torch, "fp32", on_gpu=True) == {}
+    assert _bert_model_kwargs(torch, "fp16", on_gpu=False) == {"torch_dtype": "f16"}
+
+    with pytest.raises(ValueError, match="Unknown precision"):
+        BertDetector(precision="fp8")
+
+
 def test_hybrid_detector_overlap_resolution():
     # Overlapping spans
     span1 = EntitySpan(0, 10, "PERSON", 0.8, "spacy", "John Smith")
@@ -195,3 +571,30 @@ def test_bert_detector_download_declined(mock_getenv, mock_console_class):
             BertDetector(model_name="dslim/bert-base-NER")
 
         assert "download declined" in str(exc_info.value)
+
+
+def test_regex_detector_pickles():
+    detector = RegexDetector({"EMAIL": r"\S+@\S+"})
+    restored = pickle.loads(pickle.dumps(detector))
+    spans = restored.detect("mail a@b.com now")
+    assert [(s.label, s.text) for s in spans] == [("EMAIL", "a@b.com")]
+
+
+def test_split_sentences():
+    from veildata.detectors import split_sentences
+
+    text = "Hi there. How are you?  Fine!"
+    assert split_sentences(text) == [
+        (0, "Hi there."),
+        (10, "How are you?"),
+        (24, "Fine!"),
+    ]
+    assert split_sentences("") == []
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses")
+def test_entity_span_is_slotted():
+    span = EntitySpan(0, 4, "PERSON", 1.0, "regex", "John")
+
+    assert not hasattr(span, "__dict__")
+    assert pickle.loads(pickle.dumps(span)) == span
@@ -43,14 +43,14 @@ def test_e2e_redact_reveal_flow():
         assert result.exit_code == 0
 
         # Verify redacted output
-        redacted_content = Path("redacted.txt").read_text()
-        assert "[EMAIL_" in redacted_content
-        assert "test@example.com" not in redacted_content
+        redacted_content = Path("redacted.txt").read_bytes()
+        assert b"[EMAIL_" in redacted_content
+        assert b"test@example.com" not in redacted_content
         assert Path("store.json").exists()
 
         # Debug: Print store content
-        store_content = Path("store.json").read_text()
-        assert "{}" not in store_content, "Store is empty!"
+        store_content = Path("store.json").read_bytes()
+        assert b"{}" not in store_content, "Store is empty!"
 
         # Step 2: Reveal
         # veildata reveal redacted.txt --store store.json
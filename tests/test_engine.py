@@ -1,3 +1,5 @@
+import subprocess
+import sys
 from unittest.mock import patch
 
 import pytest
@@ -52,6 +54,37 @@ def test_build_redactor_regex():
     assert store is not None
 
 
+def test_regex_redactor_does_not_import_ml_libraries():
+    """Rules-only use must not pay for spaCy/torch/transformers imports."""
+    code = (
+        "import sys\n"
+        "from veildata.core.config import VeilConfig\n"
+        "from veildata.engine import build_redactor\n"
+        "redactor, _ = build_redactor(config=VeilConfig(patterns={'T': 't'}))\n"
+        "redactor('t')\n"
+        "print(sorted({'spacy', 'torch', 'transformers'} & set(sys.modules)))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_build_redactor_reuses_compiled_defaults():
+    from veildata.defaults import (
+        DEFAULT_COMPILED_PATTERNS,
+        DEFAULT_PATTERNS,
+        DEFAULT_UNION_PATTERN,
+    )
+
+    config = VeilConfig(patterns=DEFAULT_PATTERNS)
+    redactor, _ = build_redactor(method="regex", config=config)
+
+    for label, pattern in DEFAULT_COMPILED_PATTERNS.items():
+        assert redactor.detector.patterns[label] is pattern
+    assert redactor.detector._union is DEFAULT_UNION_PATTERN
+
+
 @patch("veildata.engine.load_config")
 @patch("veildata.detectors.SpacyDetector")
 def test_build_redactor_spacy_ml(mock_spacy, mock_load_config):
@@ -66,6 +99,19 @@ def test_build_redactor_spacy_ml(mock_spacy, mock_load_config):
     mock_spacy.assert_called()
 
 
+@patch("veildata.detectors.SpacyDetector")
+def test_build_redactor_spacy_gpu_settings(mock_spacy):
+    config = VeilConfig(
+        patterns={"dummy": "pattern"},
+        ml={"spacy": {"enabled": True, "use_gpu": True, "batch_size": 256}},
+    )
+    build_redactor(method="ner_spacy", detect_mode="ml", config=config)
+
+    kwargs = mock_spacy.call_args.kwargs
+    assert kwargs["use_gpu"] is True
+    assert kwargs["batch_size"] == 256
+
+
 @patch("veildata.engine.load_config")
 @patch("veildata.detectors.BertDetector")
 def test_build_redactor_bert_ml(mock_bert, mock_load_config):
@@ -86,3 +132,99 @@ def test_build_revealer(tmp_path):
 
     revealer = build_revealer(str(store_path))
     assert revealer("This is [REDACTED_1]") == "This is secret"
+
+
+def test_token_store_round_trips_unicode(tmp_path):
+    store = TokenStore()
+    store.record("[PERSON_1]", "José Müller")
+    store_path = tmp_path / "tokens.json"
+    store.save(str(store_path))
+
+    assert "José Müller" in store_path.read_text(encoding="utf-8")
+    assert TokenStore.load(str(store_path)).mappings == store.mappings
+
+
+@pytest.mark.parametrize("ahocorasick", [True, False])
+def test_token_store_reveal_single_pass(ahocorasick, monkeypatch):
+    if ahocorasick:
+        pytest.importorskip("ahocorasick")
+    else:
+        monkeypatch.setitem(sys.modules, "ahocorasick", None)
+    store = TokenStore()
+    store.bulk_record({"[P_1]": "[P_10]", "[P_10]": "Ann"})
+
+    # Longest token wins, and revealed values are not rescanned
+    assert store.reveal("[P_10] and [P_1].") == "Ann and [P_10]."
+
+    store.record("[P_2]", "Bob")
+    assert store.reveal("[P_2]") == "Bob"
+    store.clear()
+    assert store.reveal("[P_2]") == "[P_2]"
+
+
+def test_redact_with_defaults():
+    from veildata.defaults import redact_with_defaults
+
+    text = "mail a@b.com from 10.0.0.1, ssn 123-45-6789"
+    assert redact_with_defaults(text) == "mail <EMAIL> from <IPV4>, ssn <SSN>"
+
+
+def test_compile_redactor_caches_per_pattern_set():
+    from veildata.defaults import compile_redactor
+
+    patterns = {"E MAIL": r"\S+@\S+", "NUM": r"\d+"}
+    redact = compile_redactor(patterns)
+
+    assert redact("x a@b 12") == "x <E MAIL> <NUM>"
+    assert compile_redactor(dict(patterns)) is redact
+
+
+def test_build_redactor_falls_back_when_engine_missing(monkeypatch, capsys):
+    # A None entry in sys.modules makes the import raise ImportError
+    monkeypatch.setitem(sys.modules, "hyperscan", None)
+    config = VeilConfig(patterns={"EMAIL": r"\S+@\S+"})
+
+    redactor, _ = build_redactor(
+        method="regex", config=config, regex_engine="hyperscan"
+    )
+
+    assert redactor.detector.engine == "re"
+    assert "Falling back" in capsys.readouterr().err
+    assert redactor("mail a@b.com") == "mail [EMAIL_1]"
+
+
+def test_build_redactor_reuses_detector_with_fresh_store():
+    config = VeilConfig(patterns={"EMAIL": r"\S+@\S+"})
+
+    first, first_store = build_redactor(method="regex", config=config)
+    second, second_store = build_redactor(method="regex", config=config)
+    uncached, _ = build_redactor(method="regex", config=config, use_cache=False)
+
+    assert first.detector is second.detector
+    assert uncached.detector is not first.detector
+    assert first_store is not second_store
+
+    first("mail a@b.com")
+    assert second("mail c@d.com") == "mail [EMAIL_1]"
+    assert second_store.mappings == {"[EMAIL_1]": "c@d.com"}
+
+
+def test_detector_cache_is_bounded(monkeypatch):
+    from veildata import engine
+
+    monkeypatch.setattr(engine, "_DETECTOR_CACHE", engine.OrderedDict())
+    monkeypatch.setattr(engine, "_DETECTOR_CACHE_SIZE", 2)
+
+    def build(label):
+        redactor, _ = build_redactor(
+            method="regex", config=VeilConfig(patterns={label: "x"})
+        )
+        return redactor.detector
+
+    a, b = build("A"), build("B")
+    assert build("A") is a  # hit; A becomes most recently used
+    build("C")  # evicts B
+
+    assert len(engine._DETECTOR_CACHE) == 2
+    assert build("A") is a
+    assert build("B") is not b
@@ -43,7 +43,7 @@ def test_cli_config_missing_error(mock_build_redactor):
     mock_build_redactor.side_effect = ConfigMissingError("Config file not found")
 
     # We need to patch the console object in cli.py to verify print_error calls
-    with patch("veildata.cli.console") as mock_console:
+    with patch("veildata.cli._console") as mock_console:
         result = runner.invoke(app, ["redact", "input.txt", "--config", "missing.yaml"])
 
         assert result.exit_code == 1
@@ -68,7 +68,7 @@ def test_cli_os_error(mock_build_redactor):
     # Simulate OSError
     mock_build_redactor.side_effect = OSError("Model download declined")
 
-    with patch("veildata.cli.console") as mock_console:
+    with patch("veildata.cli._console") as mock_console:
         result = runner.invoke(app, ["redact", "input.txt"])
 
         assert result.exit_code == 1
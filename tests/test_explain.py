@@ -1,24 +1,19 @@
 import json
-import subprocess
-import sys
 
+from typer.testing import CliRunner
 
-def run_cli(args):
-    """Helper to run the CLI via subprocess."""
-    cmd = [sys.executable, "-m", "veildata.cli"] + args
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    return result
+from veildata.cli import app
 
+runner = CliRunner()
 
-def test_explain_mode_regex(tmp_path):
+
+def test_explain_mode_regex(email_config_path):
     """Test --explain with regex detection."""
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text(
-        'patterns:\n  EMAIL: "[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\\\.[a-zA-Z]{2,}"\n'
-    )
+    config_file = email_config_path
 
     input_text = "Contact me at test@example.com for details."
-    result = run_cli(
+    result = runner.invoke(
+        app,
         [
             "redact",
             input_text,
@@ -27,10 +22,10 @@ def test_explain_mode_regex(tmp_path):
             "--config",
             str(config_file),
             "--explain",
-        ]
+        ],
     )
 
-    assert result.returncode == 0, f"STDERR: {result.stderr}"
+    assert result.exit_code == 0, result.output
 
     # Parse JSON output
     explanation = json.loads(result.stdout)
@@ -47,17 +42,15 @@ def test_explain_mode_regex(tmp_path):
     assert detection["score"] == 1.0
 
 
-def test_explain_mode_output_file(tmp_path):
+def test_explain_mode_output_file(tmp_path, phone_config_path):
     """Test --explain with output file."""
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text(
-        'patterns:\n  PHONE: "\\\\b\\\\d{3}-\\\\d{3}-\\\\d{4}\\\\b"\n'
-    )
+    config_file = phone_config_path
 
     output_file = tmp_path / "explanation.json"
     input_text = "Call 555-123-4567"
 
-    result = run_cli(
+    result = runner.invoke(
+        app,
         [
             "redact",
             input_text,
@@ -68,10 +61,10 @@ def test_explain_mode_output_file(tmp_path):
             "--explain",
             "--output",
             str(output_file),
-        ]
+        ],
     )
 
-    assert result.returncode == 0
+    assert result.exit_code == 0
     assert output_file.exists()
 
     # Read and parse JSON
@@ -83,15 +76,13 @@ def test_explain_mode_output_file(tmp_path):
     assert explanation["detections"][0]["detector"] == "regex"
 
 
-def test_explain_mode_no_detections(tmp_path):
+def test_explain_mode_no_detections(email_config_path):
     """Test --explain when no PII is detected."""
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text(
-        'patterns:\n  EMAIL: "[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\\\.[a-zA-Z]{2,}"\n'
-    )
+    config_file = email_config_path
 
     input_text = "This text has no PII."
-    result = run_cli(
+    result = runner.invoke(
+        app,
         [
             "redact",
             input_text,
@@ -100,10 +91,10 @@ def test_explain_mode_no_detections(tmp_path):
             "--config",
             str(config_file),
             "--explain",
-        ]
+        ],
     )
 
-    assert result.returncode == 0
+    assert result.exit_code == 0
     explanation = json.loads(result.stdout)
 
     assert explanation["original"] == input_text
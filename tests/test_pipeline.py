@@ -1,6 +1,6 @@
 from unittest.mock import MagicMock
 
-from veildata.detectors import EntitySpan
+from veildata.detectors import EntitySpan, RegexDetector
 from veildata.pipeline import DetectionPipeline
 from veildata.revealers import TokenStore
 
@@ -31,6 +31,17 @@ def test_pipeline_with_store():
     assert store.mappings["[REDACTED_1]"] == "John"
 
 
+def test_pipeline_clean_text_returned_as_is():
+    detector = MagicMock()
+    detector.detect.return_value = []
+
+    pipeline = DetectionPipeline(detector)
+    text = "".join(["nothing ", "to redact"])
+
+    assert pipeline(text) is text
+    assert pipeline.counter == 0
+
+
 def test_pipeline_multiple_spans():
     detector = MagicMock()
     detector.detect.return_value = [
@@ -61,6 +72,34 @@ def test_pipeline_overlapping_spans_filtered():
     assert redacted == "[REDACTED_1]6"
 
 
+def test_pipeline_forward_many():
+    detector = MagicMock()
+    detector.detect_batch.return_value = [
+        [EntitySpan(0, 4, "A", 1.0, "mock", "John")],
+        [],
+    ]
+
+    pipeline = DetectionPipeline(detector)
+    redacted = pipeline.forward_many(["John", "nothing"])
+
+    detector.detect_batch.assert_called_once_with(["John", "nothing"])
+
+    assert redacted == ["[REDACTED_1]", "nothing"]
+    assert pipeline.counter == 1
+
+
+def test_pipeline_forward_many_workers():
+    pipeline = DetectionPipeline(
+        RegexDetector({"EMAIL": r"\S+@\S+"}), redaction_format="[{label}_{counter}]"
+    )
+    texts = [f"user{i}@example.com" if i % 2 else "nothing" for i in range(10)]
+
+    redacted = pipeline.forward_many(texts, workers=2)
+
+    assert redacted[:4] == ["nothing", "[EMAIL_1]", "nothing", "[EMAIL_2]"]
+    assert pipeline.counter == 5
+
+
 def test_pipeline_explain():
     detector = MagicMock()
     detector.detect.return_value = [
@@ -96,3 +135,33 @@ def test_pipeline_explain_overlapping():
     # Should filter overlaps same as forward()
     assert len(explanation["detections"]) == 1
     assert explanation["detections"][0]["text"] == "12345"
+
+
+def test_pipeline_redact_to_writes_pieces():
+    detector = MagicMock()
+    detector.detect.return_value = [EntitySpan(7, 11, "PERSON", 1.0, "mock", "John")]
+
+    store = TokenStore()
+    pipeline = DetectionPipeline(detector, store=store)
+    pieces = []
+    pipeline.redact_to("Hello, John!", pieces.append)
+
+    assert "".join(pieces) == "Hello, [REDACTED_1]!"
+    assert store.mappings["[REDACTED_1]"] == "John"
+
+
+def test_pipeline_regex_fast_path_matches_span_path():
+    detector = RegexDetector({"E-MAIL": r"\S+@\S+", "PHONE": r"\d{3}-\d{4}"})
+    text = "mail a@b.c or x@y.z, call 555-1234"
+
+    fused = DetectionPipeline(
+        detector, store=TokenStore(), redaction_format="[{label}_{counter}]"
+    )
+    spans = DetectionPipeline(
+        detector, store=TokenStore(), redaction_format="[{label}_{counter}]"
+    )
+
+    assert fused(text) == spans._redact_spans(text, detector.detect(text))
+    assert fused(text).startswith("mail [E-MAIL_4] or [E-MAIL_5]")
+    assert fused.store.mappings["[PHONE_3]"] == "555-1234"
+    assert fused.counter == 6
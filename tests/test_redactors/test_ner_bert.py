@@ -414,3 +414,133 @@ def test_forward_empty_text(mock_model_and_tokenizer):
 
     result = redactor("")
     assert result == ""
+
+
+def test_forward_batch(mock_model_and_tokenizer):
+    """Test forward_batch runs the model once per batch of texts."""
+    redactor = BERTNERRedactor(batch_size=2)
+    redactor._get_entity_spans_batch = MagicMock(
+        side_effect=[
+            [[{"start": 0, "end": 4, "label": "PER", "text": "John"}], []],
+            [[{"start": 4, "end": 8, "label": "PER", "text": "Jane"}]],
+        ]
+    )
+
+    result = redactor.forward_batch(["John left.", "Nobody.", "Hi, Jane"])
+
+    assert result == ["[REDACTED_1] left.", "Nobody.", "Hi, [REDACTED_2]"]
+    assert redactor._get_entity_spans_batch.call_count == 2
+
+
+def test_forward_batches_sentences(mock_model_and_tokenizer):
+    """Test forward splits long text into sentences and shifts offsets back."""
+    redactor = BERTNERRedactor(batch_size=16)
+    redactor._get_entity_spans_batch = MagicMock(
+        return_value=[
+            [{"start": 0, "end": 4, "label": "PER", "text": "John"}],
+            [{"start": 12, "end": 21, "label": "ORG", "text": "Microsoft"}],
+        ]
+    )
+
+    result = redactor("John is here. He works at Microsoft.")
+
+    redactor._get_entity_spans_batch.assert_called_once_with(
+        ["John is here.", "He works at Microsoft."]
+    )
+    assert result == "[REDACTED_2] is here. He works at [REDACTED_1]."
+
+
+def test_autocast_dtype_per_device(mock_model_and_tokenizer):
+    """Autocast uses bf16 on CPU and fp16 on CUDA, and is off by default."""
+    with patch("torch.autocast") as mock_autocast:
+        BERTNERRedactor(device="cpu")._autocast_context()
+        mock_autocast.assert_not_called()
+
+        BERTNERRedactor(device="cpu", autocast=True)._autocast_context()
+        mock_autocast.assert_called_with(device_type="cpu", dtype=torch.bfloat16)
+
+        BERTNERRedactor(device="cuda", autocast=True)._autocast_context()
+        mock_autocast.assert_called_with(device_type="cuda", dtype=torch.float16)
+
+
+def test_quantize_on_cpu_only(mock_model_and_tokenizer, capsys):
+    """quantize=True applies dynamic INT8 quantization on CPU only."""
+    with patch("torch.ao.quantization.quantize_dynamic") as mock_quantize:
+        redactor = BERTNERRedactor(device="cpu", quantize=True)
+        mock_quantize.assert_called_once()
+        assert redactor.quantized
+        assert redactor.model is mock_quantize.return_value
+
+        mock_quantize.reset_mock()
+        redactor = BERTNERRedactor(device="cuda", quantize=True)
+        mock_quantize.assert_not_called()
+        assert not redactor.quantized
+        assert "only runs on CPU" in capsys.readouterr().err
+
+
+def test_entity_cache_skips_repeated_texts(mock_model_and_tokenizer):
+    """Repeated texts reuse cached entities; the LRU bound is respected."""
+    redactor = BERTNERRedactor(cache_size=2)
+    redactor._infer_entity_spans = MagicMock(
+        side_effect=lambda texts: [
+            [{"start": 0, "end": 4, "label": "PER", "text": t[:4]}] for t in texts
+        ]
+    )
+
+    assert redactor.forward_batch(["John hi", "John hi"]) == [
+        "[REDACTED_1] hi",
+        "[REDACTED_2] hi",
+    ]
+    redactor._infer_entity_spans.assert_called_once_with(["John hi"])
+
+    redactor("John hi")
+    assert redactor._infer_entity_spans.call_count == 1
+
+    redactor("Anna a")
+    redactor("Bert b")
+    assert list(redactor._span_cache) == ["Anna a", "Bert b"]
+
+    redactor.train(False)
+    assert not redactor._span_cache
+
+
+def test_optimize_compiles_model(mock_model_and_tokenizer, capsys):
+    """optimize=True runs IPEX when installed and then torch.compile."""
+    fake_ipex = MagicMock()
+    with (
+        patch("torch.compile") as mock_compile,
+        patch.dict("sys.modules", {"intel_extension_for_pytorch": fake_ipex}),
+    ):
+        redactor = BERTNERRedactor(device="cpu", optimize=True, autocast=True)
+        fake_ipex.optimize.assert_called_once()
+        assert fake_ipex.optimize.call_args.kwargs["dtype"] is torch.bfloat16
+        mock_compile.assert_called_once_with(
+            fake_ipex.optimize.return_value, dynamic=True
+        )
+        assert redactor.model is mock_compile.return_value
+
+    with (
+        patch("torch.compile") as mock_compile,
+        patch.dict("sys.modules", {"intel_extension_for_pytorch": None}),
+    ):
+        BERTNERRedactor(device="cpu", optimize=True)
+        mock_compile.assert_called_once()
+    assert "intel_extension_for_pytorch is not installed" in capsys.readouterr().err
+
+
+def test_group_entities_reads_text_from_offsets(mock_model_and_tokenizer):
+    """Multi-token entities keep their spacing; a stray I- token is dropped."""
+    import numpy as np
+
+    redactor = BERTNERRedactor(store=TokenStore())
+    text = "John Smith met Bob"
+    # [CLS] John Smith met Bob [SEP]: B-PER I-PER O I-PER
+    entities = redactor._group_entities(
+        text,
+        np.array([0, 1, 2, 0, 2, 0]),
+        np.array([(0, 0), (0, 4), (5, 10), (11, 14), (15, 18), (0, 0)]),
+        np.array([1, 0, 0, 0, 0, 1]),
+    )
+
+    assert entities == [{"start": 0, "end": 10, "label": "PER", "text": "John Smith"}]
+    assert redactor._redact_entities(text, entities) == "[REDACTED_1] met Bob"
@@ -17,7 +17,10 @@ def test_ner_spacy_init(mock_spacy):
     assert redactor.store is None
 
     # Verify load was called
-    mock_spacy.load.assert_called_with("en_core_web_sm", disable=["parser", "tagger"])
+    mock_spacy.load.assert_called_with(
+        "en_core_web_sm",
+        exclude=["parser", "tagger", "lemmatizer", "attribute_ruler", "senter"],
+    )
 
 
 @patch("veildata.redactors.ner_spacy.spacy")
@@ -65,6 +68,28 @@ def test_ner_spacy_forward(mock_spacy):
     assert "Apple" in result  # Not in our entities list
 
 
+@patch("veildata.redactors.ner_spacy.spacy")
+def test_ner_spacy_forward_multiple_entities(mock_spacy):
+    """Entities are numbered from the end and surrounding text is kept."""
+    mock_nlp = MagicMock()
+    mock_spacy.load.return_value = mock_nlp
+
+    def ent(label, start, end, text):
+        return MagicMock(label_=label, start_char=start, end_char=end, text=text)
+
+    text = "John met Mary in Paris."
+    mock_nlp.return_value = MagicMock(
+        ents=[
+            ent("PERSON", 0, 4, "John"),
+            ent("PERSON", 9, 13, "Mary"),
+            ent("GPE", 17, 22, "Paris"),
+        ]
+    )
+
+    redactor = SpacyNERRedactor(entities=["PERSON"])
+    assert redactor(text) == "[REDACTED_2] met [REDACTED_1] in Paris."
+
+
 @patch("veildata.redactors.ner_spacy.spacy")
 def test_ner_spacy_forward_no_entities(mock_spacy):
     """Test SpacyNERRedactor when no entities are found."""
@@ -106,3 +131,35 @@ def test_ner_spacy_with_store_integration(mock_spacy):
     assert "[REDACTED_1]" in result
     assert store.mappings["[REDACTED_1]"] == "John"
     assert store.reveal(result) == "Hello, John!"
+
+
+@patch("veildata.redactors.ner_spacy.spacy")
+def test_ner_spacy_use_gpu(mock_spacy):
+    """Test use_gpu activates the GPU before the model is loaded."""
+    calls = []
+    mock_spacy.prefer_gpu.side_effect = lambda: calls.append("gpu") or True
+    mock_spacy.load.side_effect = lambda *a, **kw: calls.append("load") or MagicMock()
+
+    SpacyNERRedactor(use_gpu=True)
+
+    assert calls == ["gpu", "load"]
+
+
+@patch("veildata.redactors.ner_spacy.spacy")
+def test_ner_spacy_forward_batch(mock_spacy):
+    """Test forward_batch runs all texts through nlp.pipe."""
+    mock_nlp = MagicMock()
+    mock_spacy.load.return_value = mock_nlp
+
+    mock_ent = MagicMock()
+    mock_ent.label_ = "PERSON"
+    mock_ent.start_char = 0
+    mock_ent.end_char = 4
+    mock_ent.text = "John"
+    mock_nlp.pipe.return_value = iter([MagicMock(ents=[mock_ent]), MagicMock(ents=[])])
+
+    redactor = SpacyNERRedactor(entities=["PERSON"], batch_size=32)
+    result = redactor.forward_batch(["John left", "Nobody"])
+
+    assert result == ["[REDACTED_1] left", "Nobody"]
+    mock_nlp.pipe.assert_called_once_with(["John left", "Nobody"], batch_size=32)
@@ -82,3 +82,71 @@ def test_regex_redactor_counter_increments():
     # Both should be in store
     assert store.mappings["[REDACTED_1]"] == "123"
     assert store.mappings["[REDACTED_2]"] == "456"
+
+
+def test_regex_redactor_multiple_patterns():
+    """Test that a label -> pattern mapping is redacted in one pass."""
+    store = TokenStore()
+    redactor = RegexRedactor(
+        pattern={"PHONE": r"\b\d{3}-\d{4}\b", "E-MAIL": r"\b\w+@\w+\.com\b"},
+        redaction_token="[{label}_{counter}]",
+        store=store,
+    )
+
+    redacted = redactor("Call 555-1234 or mail jo@example.com")
+
+    assert redacted == "Call [PHONE_1] or mail [E-MAIL_2]"
+    assert store.mappings == {"[PHONE_1]": "555-1234", "[E-MAIL_2]": "jo@example.com"}
+
+
+def test_compose_fuses_regex_redactors():
+    from veildata.compose import Compose
+
+    store = TokenStore()
+    compose = Compose(
+        [
+            RegexRedactor(r"\S+@\S+", redaction_token="[EMAIL_{counter}]", store=store),
+            RegexRedactor(r"\d{3}-\d{4}", redaction_token="[PHONE_{counter}]"),
+            RegexRedactor(r"example", redaction_token="[WORD_{counter}]"),
+        ]
+    )
+
+    result = compose("a@example.com or 555-1234, example")
+
+    # The email wins over the overlapping "example" match of a later module
+    assert result == "[EMAIL_1] or [PHONE_1], [WORD_1]"
+    assert store.mappings == {"[EMAIL_1]": "a@example.com"}
+
+
+def test_compose_fused_matches_sequential_on_overlaps():
+    from veildata.compose import Compose
+
+    def build(store):
+        return [
+            RegexRedactor(r"b c", store=store),
+            RegexRedactor(r"a b|c d", store=store),
+            RegexRedactor(r"\d{3}-\d{4}", redaction_token="<{counter}>", store=store),
+        ]
+
+    for text in ["a b c", "a b c d", "555-1234 a b c d e a b 555-9876", "c d a b c"]:
+        fused_store, sequential_store = TokenStore(), TokenStore()
+        fused = Compose(build(fused_store))(text)
+
+        sequential = text
+        for module in build(sequential_store):
+            sequential = module(sequential)
+
+        assert fused == sequential, text
+        assert fused_store.mappings == sequential_store.mappings, text
+
+
+def test_regex_redactor_token_templates():
+    """Counter-only templates take the prefix/suffix path; others use format."""
+    text = "a 555-1234 b 555-9876"
+    for template, expected in [
+        ("<{counter}>", "a <1> b <2>"),
+        ("{{id:{counter}}}", "a {id:1} b {id:2}"),
+        ("[{label}_{counter:03d}]", "a [PHONE_001] b [PHONE_002]"),
+    ]:
+        redactor = RegexRedactor({"PHONE": r"\d{3}-\d{4}"}, redaction_token=template)
+        assert redactor(text) == expected
@@ -1,12 +1,8 @@
-import subprocess
-import sys
+from typer.testing import CliRunner
 
+from veildata.cli import app
 
-def run_cli(args):
-    """Helper to run the CLI via subprocess."""
-    cmd = [sys.executable, "-m", "veildata.cli"] + args
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    return result
+runner = CliRunner()
 
 
 def test_wizard_regex_config(tmp_path):
@@ -16,8 +12,8 @@ def test_wizard_regex_config(tmp_path):
     config_file.write_text('method = "regex"\n')
 
     input_text = "Call 555-123-4567"
-    result = run_cli(["redact", input_text, "--config", str(config_file)])
+    result = runner.invoke(app, ["redact", input_text, "--config", str(config_file)])
 
-    assert result.returncode == 0, f"STDERR: {result.stderr}"
+    assert result.exit_code == 0, result.output
     assert "[PHONE_1]" in result.stdout
     assert "555-123-4567" not in result.stdout
@@ -401,6 +401,20 @@ def test_unicode_at_boundary(email_pipeline):
     assert "[REDACTED_1]" in full_output
 
 
+def test_bytes_chunks_with_split_multibyte_character(email_pipeline):
+    """Test bytes chunks, including a UTF-8 character split across chunks."""
+    buffer = StreamingRedactionBuffer(email_pipeline, overlap_size=10)
+
+    data = "Café owner: john@example.com, naïve".encode("utf-8")
+    split = data.index("é".encode("utf-8")) + 1  # Inside the two-byte "é"
+
+    output = buffer.add_chunk(data[:split])
+    output += buffer.add_chunk(data[split:])
+    output += buffer.finalize()
+
+    assert output == "Café owner: [REDACTED_1], naïve"
+
+
 def test_very_long_entity(email_pipeline):
     """Test handling of very long entities."""
     buffer = StreamingRedactionBuffer(email_pipeline, overlap_size=20)
@@ -441,6 +455,19 @@ def test_metadata_tracking(email_pipeline):
     assert metadata[1].chunk_index == 1
 
 
+def test_metadata_history_is_bounded(email_pipeline):
+    """Only the most recent metadata records are kept."""
+    buffer = StreamingRedactionBuffer(
+        email_pipeline, overlap_size=5, metadata_history=3
+    )
+    for i in range(10):
+        buffer.add_chunk(f"Chunk number {i}. ")
+
+    metadata = buffer.get_metadata()
+    assert [m.chunk_index for m in metadata] == [7, 8, 9]
+    assert buffer.get_stats()["total_chunks"] == 10
+
+
 def test_statistics(email_pipeline):
     """Test that statistics are correctly computed."""
     buffer = StreamingRedactionBuffer(email_pipeline, overlap_size=10)
@@ -498,6 +525,32 @@ def test_stream_redact_generator(email_pipeline):
     assert "and more text." in full_output
 
 
+def test_min_scan_size_bounds_rescans(email_detector):
+    """Small chunks are coalesced so the overlap is not rescanned per chunk."""
+    calls = []
+
+    class CountingDetector:
+        def detect(self, text):
+            calls.append(len(text))
+            return email_detector.detect(text)
+
+    pipeline = DetectionPipeline(CountingDetector())
+    text = "".join(f"Row {i}: user{i}@example.com. " for i in range(50))
+    outputs = {}
+    for min_scan_size in (0, 100):
+        calls.clear()
+        buffer = StreamingRedactionBuffer(
+            pipeline, overlap_size=100, min_scan_size=min_scan_size
+        )
+        pieces = [buffer.add_chunk(text[i : i + 5]) for i in range(0, len(text), 5)]
+        outputs[min_scan_size] = "".join(pieces) + buffer.finalize()
+        scanned = sum(calls)
+
+    assert outputs[100] == outputs[0]
+    assert outputs[100].count("[REDACTED_") == 50
+    assert scanned <= 3 * len(text)
+
+
 def test_stream_redact_with_store(email_pipeline):
     """Test stream_redact with TokenStore."""
     store = TokenStore()
@@ -511,6 +564,30 @@ def test_stream_redact_with_store(email_pipeline):
     assert store.mappings["[REDACTED_1]"] == "john@example.com"
 
 
+def test_stream_redact_workers_matches_serial(multi_pattern):
+    """Parallel stream_redact stitches segments back in order."""
+    pipeline = DetectionPipeline(RegexDetector(multi_pattern))
+    text = "".join(
+        f"Row {i}: user{i}@example.com called 555-{i:04d}. " for i in range(200)
+    )
+    chunks = [text[i : i + 37] for i in range(0, len(text), 37)]
+
+    serial_store = TokenStore()
+    serial = "".join(
+        stream_redact(iter(chunks), pipeline, overlap_size=40, store=serial_store)
+    )
+    parallel_store = TokenStore()
+    parallel = "".join(
+        stream_redact(
+            iter(chunks), pipeline, overlap_size=40, store=parallel_store, workers=2
+        )
+    )
+
+    assert parallel == serial
+    assert parallel_store.mappings == serial_store.mappings
+    assert len(parallel_store.mappings) == 400
+
+
 # =========================================================================
 # Integration Tests with Real Detectors
 # =========================================================================
@@ -1,3 +1,10 @@
+import io
+import json
+
+import pytest
+
+from veildata.core.config import TraversalConfig
+from veildata.utils.json_stream import iter_redacted_json
 from veildata.utils.traversal import traverse_and_redact
 
 
@@ -43,3 +50,164 @@ def test_traverse_empty():
     assert traverse_and_redact({}, mock_redactor) == {}
     assert traverse_and_redact([], mock_redactor) == []
     assert traverse_and_redact("", mock_redactor) == ""
+
+
+def test_traverse_batch_func():
+    calls = []
+
+    def batch_redactor(texts):
+        calls.append(list(texts))
+        return [mock_redactor(t) for t in texts]
+
+    data = {"a": "abc", "b": [1, "def", "ghi"], "c": {"d": "jkl"}}
+    expected = {"a": "cba", "b": [1, "fed", "ihg"], "c": {"d": "lkj"}}
+
+    assert (
+        traverse_and_redact(data, mock_redactor, batch_func=batch_redactor) == expected
+    )
+    # One call for the whole document, leaves in document order
+    assert calls == [["abc", "def", "ghi", "jkl"]]
+
+
+def test_traverse_deeply_nested_beyond_recursion_limit():
+    import sys
+
+    data = current = {}
+    for _ in range(sys.getrecursionlimit() + 100):
+        current["child"] = {}
+        current = current["child"]
+    current["value"] = "secret"
+
+    result = traverse_and_redact(data, mock_redactor)
+
+    node = result
+    while "child" in node:
+        node = node["child"]
+    assert node["value"] == "terces"
+    # Input is left untouched
+    assert current["value"] == "secret"
+
+
+def test_traverse_respects_keys():
+    data = {"password": "abc", "nested": {"password": ["xy"], "name": "keep"}}
+
+    allow = TraversalConfig(keys_to_redact=["password"])
+    assert traverse_and_redact(data, mock_redactor, traversal=allow) == {
+        "password": "cba",
+        "nested": {"password": ["yx"], "name": "keep"},
+    }
+
+    ignore = TraversalConfig(policy="deny", keys_to_ignore=["name"])
+    assert traverse_and_redact(data, mock_redactor, traversal=ignore) == {
+        "password": "cba",
+        "nested": {"password": ["yx"], "name": "keep"},
+    }
+
+
+def test_traverse_dotted_key_path():
+    data = {"address": {"firstLine": "abc"}, "billing": {"firstLine": "abc"}}
+    expected = {"address": {"firstLine": "cba"}, "billing": {"firstLine": "abc"}}
+
+    redact = TraversalConfig(keys_to_redact=["address.firstLine"])
+    assert traverse_and_redact(data, mock_redactor, traversal=redact) == expected
+    # Batched leaves follow the same rules
+    assert (
+        traverse_and_redact(
+            data,
+            mock_redactor,
+            batch_func=lambda texts: [mock_redactor(t) for t in texts],
+            traversal=redact.to_runtime(),
+        )
+        == expected
+    )
+
+    ignore = TraversalConfig(policy="deny", keys_to_ignore=["billing.firstLine"])
+    assert traverse_and_redact(data, mock_redactor, traversal=ignore) == expected
+
+
+@pytest.mark.parametrize(
+    "traversal",
+    [
+        None,
+        TraversalConfig(policy="deny", keys_to_ignore=["c", "phone"]),
+        TraversalConfig(keys_to_redact=["b", "phone"]),
+        TraversalConfig(keys_to_redact=["f"], keys_to_ignore=["b.c"]),
+    ],
+    ids=["default", "ignore", "allow", "dotted"],
+)
+def test_iter_redacted_json_matches_eager(traversal):
+    pytest.importorskip("ijson")
+    data = {
+        "a": "abc",
+        "b": [1, 2.5, {"c": "xy", "d": []}, {}, "bb"],
+        "e": None,
+        "f": "Zoë",
+        "phone": "555-123-4567",
+    }
+    raw = io.BytesIO(json.dumps(data).encode())
+
+    streamed = "".join(iter_redacted_json(raw, mock_redactor, traversal, chunk_size=8))
+
+    expected = json.dumps(
+        traverse_and_redact(data, mock_redactor, traversal=traversal),
+        indent=2,
+        ensure_ascii=False,
+    )
+    assert streamed == expected
+
+
+def test_iter_redacted_json_respects_keys():
+    pytest.importorskip("ijson")
+    data = {"password": "abc", "nested": {"password": ["xy"], "name": "keep"}}
+    traversal = TraversalConfig(keys_to_redact=["password"])
+
+    out = "".join(
+        iter_redacted_json(
+            io.BytesIO(json.dumps(data).encode()), mock_redactor, traversal
+        )
+    )
+
+    assert json.loads(out) == {
+        "password": "cba",
+        "nested": {"password": ["yx"], "name": "keep"},
+    }
+
+    ignore = TraversalConfig(policy="deny", keys_to_ignore=["name"])
+    out = "".join(
+        iter_redacted_json(io.BytesIO(json.dumps(data).encode()), mock_redactor, ignore)
+    )
+    assert json.loads(out)["nested"] == {"password": ["yx"], "name": "keep"}
+
+
+def test_iter_redacted_json_invalid():
+    pytest.importorskip("ijson")
+    with pytest.raises(ValueError):
+        list(iter_redacted_json(io.BytesIO(b'{"a": '), mock_redactor))
+
+
+def test_iter_redacted_json_dotted_key_path():
+    pytest.importorskip("ijson")
+    data = {"address": {"firstLine": "abc"}, "billing": {"firstLine": "abc"}}
+    traversal = TraversalConfig(keys_to_redact=["address.firstLine"])
+
+    out = "".join(
+        iter_redacted_json(
+            io.BytesIO(json.dumps(data).encode()), mock_redactor, traversal
+        )
+    )
+
+    assert json.loads(out) == {
+        "address": {"firstLine": "cba"},
+        "billing": {"firstLine": "abc"},
+    }
+
+
+def test_traversal_config_sees_later_edits():
+    traversal = TraversalConfig(keys_to_redact=["a"])
+    traversal.keys_to_redact.append("b")
+
+    assert traversal.key_decision("b", "b") is True
+    assert traversal.to_runtime().key_decision("b", "b") is True
+    assert traverse_and_redact({"b": "xy"}, mock_redactor, traversal=traversal) == {
+        "b": "yx"
+    }
@@ -1,8 +1,11 @@
+import random
+import statistics
 import time
 
 import pytest
 
-from veildata.utils import Timer
+from veildata.utils import Timer, jsonio
+from veildata.utils.stats import P2Quantile
 
 
 def test_timer_context_manager():
@@ -54,3 +57,38 @@ def test_timer_restart():
     assert first_run > 0
     assert second_run > 0
     assert second_run >= 0.02
+
+
+def test_jsonio_round_trip_keeps_unicode():
+    data = {"name": "Zoë", "items": [1, 2]}
+    text = jsonio.dumps_indented(data)
+    assert "Zoë" in text
+    assert '\n  "name"' in text
+    assert jsonio.loads(text) == data
+
+
+def test_jsonio_decode_error():
+    with pytest.raises(jsonio.JSONDecodeError):
+        jsonio.loads("{not json")
+
+
+def test_p2_quantile_tracks_exact_percentiles():
+    rng = random.Random(0)
+    values = [rng.expovariate(1.0) for _ in range(20000)]
+    exact = statistics.quantiles(values, n=100)
+
+    for p, index in ((0.5, 49), (0.95, 94), (0.99, 98)):
+        estimate = P2Quantile(p)
+        for value in values:
+            estimate.add(value)
+        assert estimate.value == pytest.approx(exact[index], rel=0.02)
+
+
+def test_p2_quantile_exact_for_few_values():
+    estimate = P2Quantile(0.5)
+    for value in (3.0, 1.0, 2.0):
+        estimate.add(value)
+    assert estimate.value == 2.0
+
+    with pytest.raises(ValueError):
+        P2Quantile(0.5).value